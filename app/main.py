@@ -2,63 +2,227 @@
 
 from __future__ import annotations
 
+import codecs
+import collections
+import importlib
 import json
+import os
+import re
 import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-    WEB_AVAILABLE = True
-except Exception:
-    QWebEngineView = None
-    WEB_AVAILABLE = False
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Generated by scripts/build_qt_resources.sh; registers the :/ resources.
+    from . import resources_rc
+    RESOURCES_AVAILABLE = True
+except ImportError:
+    resources_rc = None
+    RESOURCES_AVAILABLE = False
 
 
+LayoutT = TypeVar("LayoutT", bound=QtWidgets.QLayout)
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 APP_ICON_PATH = ROOT_DIR / "assets" / "app_icon_1024.png"
 if not APP_ICON_PATH.exists():
     APP_ICON_PATH = ROOT_DIR / "assets" / "logo.png"
+if RESOURCES_AVAILABLE:
+    APP_ICON_SOURCE: Optional[str] = ":/assets/app_icon.png"
+elif APP_ICON_PATH.exists():
+    APP_ICON_SOURCE = str(APP_ICON_PATH)
+else:
+    APP_ICON_SOURCE = None
+_APP_ICON: Optional[QtGui.QIcon] = None
 RECENT_PATH = Path.home() / ".insitucore" / "recent.json"
 LEGACY_RECENT_PATH = Path.home() / ".spatial-analysis-for-dummies" / "recent.json"
-THEME_LIGHT_PATH = Path(__file__).with_name("theme_light.qss")
-THEME_DARK_PATH = Path(__file__).with_name("theme_dark.qss")
+QC_IMAGE_WIDTH = 900
+LOG_MAX_BLOCKS = 5000
+# Longer lines are elided in the log view; the full text stays in a ring for "Show full line...".
+LOG_MAX_LINE = 512
+LOG_RING_SIZE = 2000
+# Elided lines end in a marker numbering them, so each maps to exactly one ring entry.
+_LOG_ELIDED_RE = re.compile(r" \.\.\.\(\+\d+ chars, #(\d+)\)$")
+OVERWRITE_DETAIL_LIMIT = 10
+# Upper bound on one-shot plot processes a cold "Generate Plots" fans out to.
+PLOT_PROCESS_LIMIT = 4
+# Progress bars (tqdm) redraw with bare carriage returns; treat them as line ends.
+_LINE_SPLIT_RE = re.compile(r"\r\n|[\r\n]")
+_THEME_CACHE: dict[str, str] = {}
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
+# Shared by every form field: grow horizontally, keep the row height fixed.
+_FORM_FIELD_SIZE_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+
+
+def _app_icon() -> Optional[QtGui.QIcon]:
+    # Decode the icon PNG once per process and share it between app and windows.
+    global _APP_ICON
+    if _APP_ICON is None and APP_ICON_SOURCE:
+        _APP_ICON = QtGui.QIcon(APP_ICON_SOURCE)
+    return _APP_ICON
+
+
+def _get_theme_qss(mode: str) -> Optional[str]:
+    # Stylesheets are read once per process; theme toggles reuse the cached text.
+    qss = _THEME_CACHE.get(mode)
+    if qss is None:
+        theme_path = Path(__file__).with_name(f"theme_{mode}.qss")
+        qss = None
+        if RESOURCES_AVAILABLE and not _is_newer_than_resources(theme_path):
+            qss = _read_resource_text(f":/theme/{mode}.qss")
+        if qss is None:
+            try:
+                qss = theme_path.read_text(encoding="utf-8")
+            except OSError:
+                return None
+        qss = _minify_qss(qss)
+        _THEME_CACHE[mode] = qss
+    return qss
 
 
-@dataclass
+def _is_newer_than_resources(path: Path) -> bool:
+    # A .qss edited after the last build_qt_resources.sh run wins over the stale compiled copy.
+    try:
+        return path.stat().st_mtime > Path(resources_rc.__file__).stat().st_mtime
+    except (AttributeError, OSError, TypeError):
+        return False
+
+
+def _minify_qss(qss: str) -> str:
+    # setStyleSheet parse time scales with input size; drop comments and layout whitespace.
+    qss = _QSS_COMMENT_RE.sub("", qss)
+    return _QSS_SPACE_RE.sub(" ", qss).strip()
+
+
+def _read_resource_text(resource_path: str) -> Optional[str]:
+    qfile = QtCore.QFile(resource_path)
+    if not qfile.open(QtCore.QIODevice.ReadOnly):
+        return None
+    try:
+        return qfile.readAll().data().decode("utf-8")
+    finally:
+        qfile.close()
+
+
+@dataclass(slots=True)
 class RecentProject:
     data_dir: str
     out_dir: str
     karospace_html: Optional[str]
     last_used: str
 
+    @classmethod
+    def from_dict(cls, item: dict) -> "RecentProject":
+        get = item.get
+        return cls(get("data_dir", ""), get("out_dir", ""), get("karospace_html"), get("last_used", ""))
+
     def label(self) -> str:
         return f"{self.data_dir} -> {self.out_dir}"
 
 
+def _json_loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+CLUSTER_INFO_SCALAR_FIELDS = ("cluster_key", "compartment_key")
+CLUSTER_INFO_LIST_FIELDS = ("cluster_keys", "compartment_keys")
+_CLUSTER_INFO_ITEM_PREFIXES = {f"{name}.item": name for name in CLUSTER_INFO_LIST_FIELDS}
+
+
+def _load_cluster_info_keys(path: Path) -> dict:
+    """Read only the key fields of cluster_info.json; ijson streams past everything else."""
+    if ijson is None:
+        payload = _json_loads(path.read_bytes())
+        if not isinstance(payload, dict):
+            return {}
+        return {
+            name: payload[name]
+            for name in CLUSTER_INFO_SCALAR_FIELDS + CLUSTER_INFO_LIST_FIELDS
+            if name in payload
+        }
+
+    out: dict = {}
+    with path.open("rb") as handle:
+        try:
+            for prefix, event, value in ijson.parse(handle):
+                if event in ("string", "number"):
+                    if prefix in CLUSTER_INFO_SCALAR_FIELDS:
+                        out[prefix] = value
+                    elif prefix in _CLUSTER_INFO_ITEM_PREFIXES:
+                        out.setdefault(_CLUSTER_INFO_ITEM_PREFIXES[prefix], []).append(value)
+                elif event == "start_array" and prefix in CLUSTER_INFO_LIST_FIELDS:
+                    out.setdefault(prefix, [])
+        except ijson.JSONError as exc:
+            raise ValueError(str(exc)) from exc
+    return out
+
+
+# (subdirectory, suffix) pairs the output pages read from; "" is the output root.
+OUTPUT_WATCH_PATTERNS = (("", ".html"), ("data", ".json"), ("plots", ".png"), ("xenium_qc", ".png"))
+
+
+def _scan_output_files(out_dir: Path) -> Dict[Path, Tuple[int, int]]:
+    """Map each watched output file (and its folder) to (st_mtime_ns, st_size) in one pass per folder."""
+    entries: Dict[Path, Tuple[int, int]] = {}
+    for subdir, suffix in OUTPUT_WATCH_PATTERNS:
+        folder = out_dir / subdir if subdir else out_dir
+        try:
+            folder_stat = os.stat(folder)
+            entries[folder] = (folder_stat.st_mtime_ns, 0)
+            with os.scandir(folder) as scan:
+                for entry in scan:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        stat = entry.stat()
+                        entries[folder / entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            continue
+    return entries
+
+
+def _scan_signature(out_dir: Path, scan: Dict[Path, Tuple[int, int]]) -> Tuple[Tuple[str, Tuple[int, int]], ...]:
+    # Relative paths, so "~/out" and its resolved form compare equal.
+    return tuple(sorted((os.path.relpath(path, out_dir), stamp) for path, stamp in scan.items()))
+
+
 def _load_recent() -> List[RecentProject]:
-    path = RECENT_PATH if RECENT_PATH.exists() else LEGACY_RECENT_PATH
-    if not path.exists():
+    if RECENT_PATH.exists():
+        path = RECENT_PATH
+    elif LEGACY_RECENT_PATH.exists():
+        path = LEGACY_RECENT_PATH
+    else:
         return []
     try:
-        payload = json.loads(path.read_text())
-    except json.JSONDecodeError:
+        payload = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
         return []
-    projects: List[RecentProject] = []
-    for item in payload.get("projects", []):
-        projects.append(
-            RecentProject(
-                data_dir=item.get("data_dir", ""),
-                out_dir=item.get("out_dir", ""),
-                karospace_html=item.get("karospace_html"),
-                last_used=item.get("last_used", ""),
-            )
-        )
-    return projects
+    if not isinstance(payload, dict):
+        return []
+    return [RecentProject.from_dict(item) for item in payload.get("projects", [])]
 
 
 def _save_recent(projects: List[RecentProject]) -> None:
@@ -74,52 +238,255 @@ def _save_recent(projects: List[RecentProject]) -> None:
             for p in projects
         ]
     }
-    RECENT_PATH.write_text(json.dumps(payload, indent=2))
+    # Write to a sibling temp file and rename so a crash never truncates recents.
+    tmp_path = RECENT_PATH.with_suffix(".tmp")
+    tmp_path.write_bytes(_json_dumps(payload))
+    os.replace(tmp_path, RECENT_PATH)
+
+
+class _TaskSignals(QtCore.QObject):
+    finished = QtCore.Signal(int, object, str)
+
+
+class _Task(QtCore.QRunnable):
+    """Run a callable on a QThreadPool and report (job_id, result, error) back."""
+
+    def __init__(self, job_id: int, fn: Callable[[], object]) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.fn = fn
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn()
+        except Exception as exc:
+            self.signals.finished.emit(self.job_id, None, f"{type(exc).__name__}: {exc}")
+            return
+        self.signals.finished.emit(self.job_id, result, "")
+
+
+def _scaled_image_size(reader: QtGui.QImageReader, width: int) -> Optional[QtCore.QSize]:
+    size = reader.size()
+    if not size.isValid() or size.width() <= 0:
+        return None
+    return QtCore.QSize(width, max(1, round(width * size.height() / size.width())))
+
+
+def _read_scaled_image(path: str, width: int) -> QtGui.QImage:
+    """Decode an image straight at the target width (safe off the GUI thread)."""
+    reader = QtGui.QImageReader(path)
+    target = _scaled_image_size(reader, width)
+    if target is not None:
+        reader.setScaledSize(target)
+    return reader.read()
+
+
+class _LineBuffer:
+    """Decode a child's output chunks incrementally and hand back only complete lines."""
+
+    def __init__(self) -> None:
+        # Chunks can end mid-line or mid-UTF-8 sequence; both are carried to the next feed.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._residual = ""
+
+    def feed(self, data: bytes, final: bool = False) -> List[str]:
+        lines = _LINE_SPLIT_RE.split(self._residual + self._decoder.decode(data, final=final))
+        self._residual = "" if final else lines.pop()
+        return [line for line in lines if line.strip()]
+
+
+def _rgba_to_image(rgba: object, width: int) -> QtGui.QImage:
+    """Wrap (height, width, 4) renderer pixels and scale them to width (safe off the GUI thread)."""
+    rows, cols = rgba.shape[:2]
+    image = QtGui.QImage(rgba.tobytes(), cols, rows, cols * 4, QtGui.QImage.Format_RGBA8888)
+    # Both branches return an image that owns its pixels, detached from the bytes buffer.
+    if cols != width:
+        return image.scaledToWidth(width, QtCore.Qt.SmoothTransformation)
+    return image.copy()
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # Pipeline log markers -> activity stage, matched with a single regex scan per line.
+    _STAGE_MAP = {
+        "Loading run:": "Loading runs",
+        "Saved raw AnnData:": "Preparing QC",
+        "Saved QC outputs:": "QC complete",
+        "Running MANA weighted aggregation...": "MANA aggregation",
+        "Saved clustered AnnData:": "Saving clustered data",
+        "Exporting KaroSpace HTML...": "Exporting KaroSpace",
+    }
+    _STAGE_PATTERN = re.compile("|".join(re.escape(token) for token in _STAGE_MAP))
+    # Pipeline flags read straight from the form, in command-line order.
+    _ARG_SPECS: Tuple[Tuple[str, Callable[["MainWindow"], str]], ...] = (
+        ("--data-dir", lambda w: w.data_dir_edit.text().strip()),
+        ("--out-dir", lambda w: w.out_dir_edit.text().strip()),
+        ("--run-prefix", lambda w: w.run_prefix_edit.text().strip() or "output-"),
+        ("--run-search-depth", lambda w: str(w.run_search_depth_combo.currentData())),
+        ("--sample-id-source", lambda w: str(w.sample_id_source_combo.currentData())),
+        ("--count-matrix-mode", lambda w: str(w.count_matrix_mode_combo.currentData())),
+        ("--n-neighbors", lambda w: str(w.n_neighbors_spin.value())),
+        ("--n-pcs", lambda w: str(w.n_pcs_spin.value())),
+        ("--umap-min-dist", lambda w: str(w.umap_min_dist_spin.value())),
+        ("--cluster-graph-mode", lambda w: str(w.cluster_graph_mode_combo.currentData())),
+        ("--cluster-method", lambda w: str(w.cluster_method_combo.currentData())),
+        ("--kmeans-random-state", lambda w: str(w.kmeans_random_state_spin.value())),
+        ("--kmeans-n-init", lambda w: str(w.kmeans_n_init_spin.value())),
+    )
+    _TX_ARG_SPECS: Tuple[Tuple[str, Callable[["MainWindow"], str]], ...] = (
+        ("--tx-max-distance-um", lambda w: str(w.tx_max_distance_spin.value())),
+        (
+            "--tx-nucleus-distance-key",
+            lambda w: w.tx_nucleus_distance_key_edit.text().strip() or "nucleus_distance",
+        ),
+        (
+            "--tx-allowed-categories",
+            lambda w: w.tx_allowed_categories_edit.text().strip() or "predesigned_gene,custom_gene",
+        ),
+    )
+    _MANA_ARG_SPECS: Tuple[Tuple[str, Callable[["MainWindow"], str]], ...] = (
+        ("--mana-n-layers", lambda w: str(w.mana_layers.value())),
+        ("--mana-hop-decay", lambda w: str(w.mana_hop_decay.value())),
+        ("--mana-distance-kernel", lambda w: w.mana_kernel.currentText()),
+        ("--mana-representation-mode", lambda w: str(w.mana_rep_mode.currentData())),
+    )
+    # Qt.ColorScheme is fixed at runtime; resolve its members once (absent before Qt 6.5).
+    _COLOR_SCHEME_MODES = {
+        member: mode
+        for member, mode in (
+            (getattr(getattr(QtCore.Qt, "ColorScheme", None), "Dark", None), "dark"),
+            (getattr(getattr(QtCore.Qt, "ColorScheme", None), "Light", None), "light"),
+        )
+        if member is not None
+    }
+    # Files a pipeline run would overwrite, grouped so each folder is listed once.
+    _PIPELINE_OUTPUTS = (
+        ("data", ("raw.h5ad", "clustered.h5ad", "cluster_info.json", "markers_by_cluster.csv")),
+        ("xenium_qc", ("summary_by_run.csv", "gene_detection_overall.csv")),
+        ("plots", ("spatial.png", "umap.png", "compartments.png")),
+    )
+
+    # (app_visuals function, CLI command, PNG name, label attribute, key combo attribute, key argument)
+    _PLOT_SPECS = (
+        ("generate_umap_plot", "umap", "umap.png", "umap_label", "umap_key_combo", "color"),
+        (
+            "generate_compartment_map",
+            "compartments",
+            "compartments.png",
+            "compartment_label",
+            "compartment_key_combo",
+            "color",
+        ),
+        (
+            "generate_spatial_map",
+            "spatial",
+            "spatial.png",
+            "spatial_static_label",
+            "spatial_key_combo",
+            "color",
+        ),
+        (
+            "generate_gene_expression_dotplot",
+            "dotplot",
+            "gene_expression_dotplot.png",
+            "gene_expr_label",
+            "gene_expr_key_combo",
+            "groupby",
+        ),
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("InSituCore")
         self.resize(1200, 800)
         self.setMinimumSize(780, 520)
-        if APP_ICON_PATH.exists():
-            self.setWindowIcon(QtGui.QIcon(str(APP_ICON_PATH)))
+        icon = _app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
         self.process: Optional[QtCore.QProcess] = None
-        self._plot_processes: List[QtCore.QProcess] = []
+        # Plots run in-process on a single worker: pyplot state is not thread-safe.
+        self._plot_pool = QtCore.QThreadPool(self)
+        self._plot_pool.setMaxThreadCount(1)
+        self._plot_jobs: Dict[int, Tuple[_Task, Path, Optional[QtWidgets.QLabel]]] = {}
+        # Cold "Generate Plots" runs: (process, output path, label attribute, output buffer) per CLI job.
+        self._plot_processes: Dict[int, Tuple[QtCore.QProcess, Path, str, _LineBuffer]] = {}
+        self._plot_process_queue: collections.deque[Tuple[List[str], Path, str]] = collections.deque()
+        self._next_job_id = 0
+        self._visuals_module: Optional[ModuleType] = None
+        self._visuals_warmup: Optional[_Task] = None
+        self._adata_release: Optional[_Task] = None
+        # Pipeline command waiting for plot work to let go of clustered.h5ad.
+        self._pipeline_args: Optional[List[str]] = None
         self._busy_counter = 0
         self._busy_base_text = "Running"
-        self._runner_frames = ["o-/", "o_/", "o-\\", "o_\\"]
+        self._runner_frames = ("o-/", "o_/", "o-\\", "o_\\")
         self._busy_tick = 0
         self._busy_has_error = False
+        # Last (text, width) drawn in the stage label and its cached font metrics.
+        self._activity_stage_state: Optional[Tuple[str, int]] = None
+        self._activity_fm: Optional[QtGui.QFontMetrics] = None
         self.current_out_dir: Optional[Path] = None
         self.current_karospace_html: Optional[Path] = None
+        self._web_available = False
+        self._web_view_cls: Optional[type] = None
+        self._spatial_page: Optional[QtWidgets.QWidget] = None
+        self._pending_karospace: Optional[Tuple[str, Optional[int]]] = None
+        self._shown_karospace: Optional[Tuple[str, Optional[int]]] = None
+        self._cluster_info_cache: Dict[Path, Tuple[int, dict]] = {}
+        self._out_dir_fingerprint: Optional[Tuple] = None
+        # (args, output scan signature) of the last successful run, to offer Load Outputs on a repeat.
+        self._last_run: Optional[Tuple[Tuple[str, ...], Tuple]] = None
+        self._running_signature: Optional[Tuple[str, ...]] = None
+        # Set only while _load_outputs runs its loaders, so they reuse one directory scan.
+        self._output_scan: Optional[Dict[Path, Tuple[int, int]]] = None
+        self._pixmap_cache: Dict[Tuple[str, int, int], QtGui.QPixmap] = {}
+        # Image decodes get their own pool so they never queue behind a plot job.
+        self._image_pool = QtCore.QThreadPool(self)
+        self._image_pool.setMaxThreadCount(2)
+        self._image_jobs: Dict[int, Tuple[_Task, Tuple[str, int, int], QtWidgets.QLabel, str, bool]] = {}
+        self._qc_rows: Dict[Tuple[str, int], QtWidgets.QLabel] = {}
         self.recent_projects: List[RecentProject] = _load_recent()
         self._theme_mode = self._detect_system_theme()
         self._manual_theme_override = False
+        self._current_qss: Optional[str] = None
+        self._theme_mode_applied: Optional[str] = None
+
+        self._stdout_buffer = _LineBuffer()
+        # readyRead can fire for every small write of an unbuffered child; drain at most every 25 ms.
+        self._process_read_timer = QtCore.QTimer(self)
+        self._process_read_timer.setSingleShot(True)
+        self._process_read_timer.setInterval(25)
+        self._process_read_timer.timeout.connect(self._drain_process_output)
+        self._log_pending: List[str] = []
+        self._log_ring: collections.deque[str] = collections.deque(maxlen=LOG_RING_SIZE)
+        self._log_elided_count = 0
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(0)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         self._build_ui()
-        self.activity_stage.setVisible(self.width() >= 980)
+        self._stage_visible = self.width() >= 980
+        self.activity_stage.setVisible(self._stage_visible)
         self._busy_timer = QtCore.QTimer(self)
         self._busy_timer.setInterval(280)
         self._busy_timer.timeout.connect(self._animate_busy_state)
         self._apply_theme(self._theme_mode)
         self._connect_system_theme_signal()
         self._populate_recent()
+        self.recent_list.itemSelectionChanged.connect(self._on_recent_selected)
 
     def _build_ui(self) -> None:
         root = QtWidgets.QWidget()
-        root.setObjectName("Root")
-        root_layout = QtWidgets.QVBoxLayout(root)
-        root_layout.setContentsMargins(14, 14, 14, 14)
-        root_layout.setSpacing(12)
+        root.setProperty("role", "root")
+        root_layout = self._tight(QtWidgets.QVBoxLayout(root), spacing=12, margin=14)
 
         root_layout.addWidget(self._build_top_bar())
 
         self.recent_list = QtWidgets.QListWidget()
-        self.recent_list.setObjectName("RecentList")
-        self.recent_list.itemSelectionChanged.connect(self._on_recent_selected)
+        self.recent_list.setProperty("role", "recent-list")
 
         recent_box, recent_layout = self._create_card(
             "Recent Projects",
@@ -134,32 +501,83 @@ class MainWindow(QtWidgets.QMainWindow):
         recent_layout.addWidget(self.load_recent_btn)
 
         self.workspace_nav = QtWidgets.QListWidget()
-        self.workspace_nav.setObjectName("WorkspaceNav")
+        self.workspace_nav.setProperty("role", "workspace-nav")
         self.workspace_nav.setMinimumWidth(170)
         self.workspace_nav.setMaximumWidth(240)
         self.workspace_nav.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
 
         self.workspace_stack = QtWidgets.QStackedWidget()
-        workspace_pages = [
-            ("Run Pipeline", self._wrap_scroll(self._build_run_tab())),
-            ("Analysis Controls", self._wrap_scroll(self._build_analysis_tab())),
-            ("QC Gallery", self._build_qc_tab()),
-            ("Spatial Static", self._build_spatial_static_tab()),
-            ("Spatial Interactive", self._build_spatial_tab()),
-            ("UMAP", self._build_umap_tab()),
-            ("Compartment Map", self._build_compartment_tab()),
-            ("Gene Expression", self._build_gene_expression_tab()),
+
+        # cluster_info.json fields that feed each page's key combo, in display order.
+        spatial_sources = ("cluster_key", "compartment_key", "cluster_keys", "compartment_keys")
+        cluster_sources = ("cluster_key", "cluster_keys", "compartment_key", "compartment_keys")
+        compartment_sources = ("compartment_key", "compartment_keys")
+
+        # Run/Analysis hold the pipeline configuration and are built up front.
+        # Output pages (label, builder, loaders) are built on first visit and
+        # populated from current_out_dir by their loaders at that point.
+        workspace_pages: List[
+            Tuple[str, Callable[[], QtWidgets.QWidget], Tuple[Callable[[Path], None], ...]]
+        ] = [
+            ("Run Pipeline", lambda: self._wrap_scroll(self._build_run_tab()), ()),
+            ("Analysis Controls", lambda: self._wrap_scroll(self._build_analysis_tab()), ()),
+            ("QC Gallery", self._build_qc_tab, (self._load_qc_images,)),
+            (
+                "Spatial Static",
+                self._build_spatial_static_tab,
+                (
+                    self._key_combo_loader("spatial_key_combo", spatial_sources, "Auto (cluster key)"),
+                    self._load_spatial_image,
+                ),
+            ),
+            ("Spatial Interactive", self._build_spatial_tab, (self._load_karospace,)),
+            (
+                "UMAP",
+                self._build_umap_tab,
+                (
+                    self._key_combo_loader("umap_key_combo", cluster_sources, "Auto (cluster key)"),
+                    self._load_umap_image,
+                ),
+            ),
+            (
+                "Compartment Map",
+                self._build_compartment_tab,
+                (
+                    self._key_combo_loader("compartment_key_combo", compartment_sources, "Auto (primary)"),
+                    self._load_compartment_image,
+                ),
+            ),
+            (
+                "Gene Expression",
+                self._build_gene_expression_tab,
+                (
+                    self._key_combo_loader("gene_expr_key_combo", cluster_sources, "Auto (cluster key)"),
+                    self._load_gene_expression_image,
+                ),
+            ),
         ]
-        for label, page in workspace_pages:
-            self.workspace_nav.addItem(label)
-            self.workspace_stack.addWidget(page)
-        self.workspace_nav.currentRowChanged.connect(self._on_workspace_nav_changed)
+        self._pending_pages: Dict[int, Callable[[], QtWidgets.QWidget]] = {}
+        self._page_loaders: Dict[int, Tuple[Callable[[Path], None], ...]] = {}
+        self.workspace_nav.setUpdatesEnabled(False)
+        self.workspace_stack.setUpdatesEnabled(False)
+        self.workspace_nav.blockSignals(True)
+        self.workspace_nav.addItems([label for label, _, _ in workspace_pages])
+        for index, (_, builder, loaders) in enumerate(workspace_pages):
+            if loaders:
+                self.workspace_stack.addWidget(QtWidgets.QWidget())
+                self._pending_pages[index] = builder
+                self._page_loaders[index] = loaders
+            else:
+                self.workspace_stack.addWidget(builder())
         self.workspace_nav.setCurrentRow(0)
+        self.workspace_nav.blockSignals(False)
+        self.workspace_stack.setUpdatesEnabled(True)
+        self.workspace_nav.setUpdatesEnabled(True)
+        # The stack already shows page 0; connect after the initial selection.
+        self.workspace_nav.currentRowChanged.connect(self._on_workspace_nav_changed)
 
         workspace_body = QtWidgets.QWidget()
-        workspace_layout = QtWidgets.QHBoxLayout(workspace_body)
-        workspace_layout.setContentsMargins(0, 0, 0, 0)
-        workspace_layout.setSpacing(10)
+        workspace_layout = self._tight(QtWidgets.QHBoxLayout(workspace_body))
         workspace_layout.addWidget(self.workspace_nav)
         workspace_layout.addWidget(self.workspace_stack, stretch=1)
         tabs_card, tabs_layout = self._create_card("Workspace")
@@ -176,7 +594,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.setCentralWidget(root)
 
-    def _wrap_scroll(self, content: QtWidgets.QWidget) -> QtWidgets.QScrollArea:
+    @staticmethod
+    def _tight(
+        layout: LayoutT, spacing: Optional[int] = 10, margin: Union[int, Tuple[int, int]] = 0
+    ) -> LayoutT:
+        # margin is one value for all sides or (horizontal, vertical); spacing=None keeps the style's.
+        horizontal, vertical = margin if isinstance(margin, tuple) else (margin, margin)
+        layout.setContentsMargins(horizontal, vertical, horizontal, vertical)
+        if spacing is not None:
+            layout.setSpacing(spacing)
+        return layout
+
+    def _wrap_scroll(self, content: QtWidgets.QWidget) -> QtWidgets.QWidget:
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
@@ -188,21 +617,35 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if index >= self.workspace_stack.count():
             return
+        self._ensure_workspace_page(index)
         self.workspace_stack.setCurrentIndex(index)
+        if self._spatial_page is not None and self.workspace_stack.currentWidget() is self._spatial_page:
+            self._show_pending_karospace()
+
+    def _ensure_workspace_page(self, index: int) -> None:
+        builder = self._pending_pages.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.workspace_stack.widget(index)
+        page = builder()
+        self.workspace_stack.removeWidget(placeholder)
+        self.workspace_stack.insertWidget(index, page)
+        placeholder.deleteLater()
+        if self.current_out_dir is not None:
+            for loader in self._page_loaders[index]:
+                loader(self.current_out_dir)
 
     def _build_top_bar(self) -> QtWidgets.QWidget:
         top_bar = QtWidgets.QFrame()
-        top_bar.setObjectName("TopBar")
-        layout = QtWidgets.QHBoxLayout(top_bar)
-        layout.setContentsMargins(12, 10, 12, 10)
-        layout.setSpacing(8)
+        top_bar.setProperty("role", "top-bar")
+        layout = self._tight(QtWidgets.QHBoxLayout(top_bar), spacing=8, margin=(12, 10))
 
         title_col = QtWidgets.QVBoxLayout()
         title_col.setSpacing(1)
         title = QtWidgets.QLabel("InSituCore")
-        title.setObjectName("TopTitle")
+        title.setProperty("role", "top-title")
         subtitle = QtWidgets.QLabel("Local Spatial Analysis")
-        subtitle.setObjectName("TopSubtitle")
+        subtitle.setProperty("role", "top-subtitle")
         title_col.addWidget(title)
         title_col.addWidget(subtitle)
         layout.addLayout(title_col)
@@ -217,24 +660,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self.top_load_btn.clicked.connect(self._load_outputs_only)
         layout.addWidget(self.top_load_btn)
 
+        self.top_plots_btn = QtWidgets.QPushButton("Generate Plots")
+        self.top_plots_btn.clicked.connect(self._generate_all_plots)
+        layout.addWidget(self.top_plots_btn)
+
         self.theme_toggle_btn = QtWidgets.QPushButton("Dark")
         self.theme_toggle_btn.setCheckable(True)
         self.theme_toggle_btn.toggled.connect(self._toggle_theme)
         layout.addWidget(self.theme_toggle_btn)
 
         self.activity_stage = QtWidgets.QLabel("Idle")
-        self.activity_stage.setObjectName("ActivityStage")
+        self.activity_stage.setProperty("role", "activity-stage")
         self.activity_stage.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
         layout.addWidget(self.activity_stage)
 
         self.runner_glyph = QtWidgets.QLabel("o-/")
-        self.runner_glyph.setObjectName("RunnerGlyph")
+        self.runner_glyph.setProperty("role", "runner-glyph")
         self.runner_glyph.setText("   ")
         self.runner_glyph.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         layout.addWidget(self.runner_glyph)
 
         self.status_chip = QtWidgets.QLabel("Ready")
-        self.status_chip.setObjectName("StatusChip")
+        self.status_chip.setProperty("role", "status-chip")
         self.status_chip.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         layout.addWidget(self.status_chip)
         return top_bar
@@ -242,7 +689,10 @@ class MainWindow(QtWidgets.QMainWindow):
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         show_stage = self.width() >= 980
-        self.activity_stage.setVisible(show_stage)
+        # Resize events arrive continuously while dragging; only relayout on a flip.
+        if show_stage != self._stage_visible:
+            self.activity_stage.setVisible(show_stage)
+            self._stage_visible = show_stage
 
     def _create_card(
         self,
@@ -250,26 +700,26 @@ class MainWindow(QtWidgets.QMainWindow):
         subtitle: Optional[str] = None,
     ) -> tuple[QtWidgets.QFrame, QtWidgets.QVBoxLayout]:
         card = QtWidgets.QFrame()
-        card.setObjectName("Card")
-        layout = QtWidgets.QVBoxLayout(card)
-        layout.setContentsMargins(14, 12, 14, 12)
-        layout.setSpacing(10)
+        card.setProperty("role", "card")
+        layout = self._tight(QtWidgets.QVBoxLayout(card), margin=(14, 12))
 
         if title:
             title_label = QtWidgets.QLabel(title)
-            title_label.setObjectName("CardTitle")
+            title_label.setProperty("role", "card-title")
             layout.addWidget(title_label)
         if subtitle:
             subtitle_label = QtWidgets.QLabel(subtitle)
-            subtitle_label.setObjectName("CardSubtitle")
+            subtitle_label.setProperty("role", "card-subtitle")
             layout.addWidget(subtitle_label)
         return card, layout
 
+    def _add_form_row(self, form: QtWidgets.QFormLayout, label: str, widget: QtWidgets.QWidget) -> None:
+        widget.setSizePolicy(_FORM_FIELD_SIZE_POLICY)
+        form.addRow(label, widget)
+
     def _build_run_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(10)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), margin=2)
 
         data_card, data_layout = self._create_card(
             "Dataset",
@@ -282,38 +732,36 @@ class MainWindow(QtWidgets.QMainWindow):
         self.data_dir_edit = QtWidgets.QLineEdit()
         self.data_dir_edit.setPlaceholderText("/path/to/dataset")
         data_btn = QtWidgets.QPushButton("Browse")
-        data_btn.clicked.connect(lambda: self._choose_dir(self.data_dir_edit))
+        data_btn.clicked.connect(partial(self._choose_dir, self.data_dir_edit))
         data_row_w = QtWidgets.QWidget()
-        data_row = QtWidgets.QHBoxLayout(data_row_w)
-        data_row.setContentsMargins(0, 0, 0, 0)
+        data_row = self._tight(QtWidgets.QHBoxLayout(data_row_w), spacing=None)
         data_row.addWidget(self.data_dir_edit)
         data_row.addWidget(data_btn)
-        form.addRow("Data dir", data_row_w)
+        self._add_form_row(form, "Data dir", data_row_w)
 
         self.out_dir_edit = QtWidgets.QLineEdit()
         self.out_dir_edit.setPlaceholderText("/path/to/output")
         out_btn = QtWidgets.QPushButton("Browse")
-        out_btn.clicked.connect(lambda: self._choose_dir(self.out_dir_edit))
+        out_btn.clicked.connect(partial(self._choose_dir, self.out_dir_edit))
         out_row_w = QtWidgets.QWidget()
-        out_row = QtWidgets.QHBoxLayout(out_row_w)
-        out_row.setContentsMargins(0, 0, 0, 0)
+        out_row = self._tight(QtWidgets.QHBoxLayout(out_row_w), spacing=None)
         out_row.addWidget(self.out_dir_edit)
         out_row.addWidget(out_btn)
-        form.addRow("Output dir", out_row_w)
+        self._add_form_row(form, "Output dir", out_row_w)
 
         self.run_prefix_edit = QtWidgets.QLineEdit("output-")
-        form.addRow("Run prefix", self.run_prefix_edit)
+        self._add_form_row(form, "Run prefix", self.run_prefix_edit)
 
         self.run_search_depth_combo = QtWidgets.QComboBox()
         self.run_search_depth_combo.addItem("Direct folders only", 1)
         self.run_search_depth_combo.addItem("One level below samples", 2)
-        form.addRow("Run depth", self.run_search_depth_combo)
+        self._add_form_row(form, "Run depth", self.run_search_depth_combo)
 
         self.sample_id_source_combo = QtWidgets.QComboBox()
         self.sample_id_source_combo.addItem("Auto", "auto")
         self.sample_id_source_combo.addItem("From run label", "run")
         self.sample_id_source_combo.addItem("From parent folder", "parent")
-        form.addRow("Sample ID source", self.sample_id_source_combo)
+        self._add_form_row(form, "Sample ID source", self.sample_id_source_combo)
 
         self.count_matrix_mode_combo = QtWidgets.QComboBox()
         self.count_matrix_mode_combo.addItem(
@@ -324,22 +772,22 @@ class MainWindow(QtWidgets.QMainWindow):
             "Nucleus OR distance-filtered transcripts",
             "nucleus_or_distance",
         )
-        form.addRow("Count matrix mode", self.count_matrix_mode_combo)
+        self._add_form_row(form, "Count matrix mode", self.count_matrix_mode_combo)
 
         self.tx_max_distance_spin = QtWidgets.QDoubleSpinBox()
         self.tx_max_distance_spin.setDecimals(2)
         self.tx_max_distance_spin.setRange(0.0, 200.0)
         self.tx_max_distance_spin.setSingleStep(0.5)
         self.tx_max_distance_spin.setValue(5.0)
-        form.addRow("Tx max distance (um)", self.tx_max_distance_spin)
+        self._add_form_row(form, "Tx max distance (um)", self.tx_max_distance_spin)
 
         self.tx_nucleus_distance_key_edit = QtWidgets.QLineEdit("nucleus_distance")
         self.tx_nucleus_distance_key_edit.setPlaceholderText("e.g. nucleus_distance")
-        form.addRow("Tx distance key", self.tx_nucleus_distance_key_edit)
+        self._add_form_row(form, "Tx distance key", self.tx_nucleus_distance_key_edit)
 
         self.tx_allowed_categories_edit = QtWidgets.QLineEdit("predesigned_gene,custom_gene")
         self.tx_allowed_categories_edit.setPlaceholderText("comma-separated categories")
-        form.addRow("Tx categories", self.tx_allowed_categories_edit)
+        self._add_form_row(form, "Tx categories", self.tx_allowed_categories_edit)
         data_layout.addLayout(form)
         self.count_matrix_mode_combo.currentIndexChanged.connect(self._sync_count_matrix_controls)
         self._sync_count_matrix_controls()
@@ -371,11 +819,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         mana_form = QtWidgets.QFormLayout()
         mana_form.addRow(self.mana_check)
-        mana_form.addRow("Layers", self.mana_layers)
-        mana_form.addRow("Hop decay", self.mana_hop_decay)
-        mana_form.addRow("Distance kernel", self.mana_kernel)
-        mana_form.addRow("Representation", self.mana_rep_mode)
-        mana_form.addRow("Custom rep key", self.mana_custom_rep_edit)
+        self._add_form_row(mana_form, "Layers", self.mana_layers)
+        self._add_form_row(mana_form, "Hop decay", self.mana_hop_decay)
+        self._add_form_row(mana_form, "Distance kernel", self.mana_kernel)
+        self._add_form_row(mana_form, "Representation", self.mana_rep_mode)
+        self._add_form_row(mana_form, "Custom rep key", self.mana_custom_rep_edit)
         options_layout.addLayout(mana_form)
         self.mana_rep_mode.currentIndexChanged.connect(self._sync_mana_rep_controls)
         self._sync_mana_rep_controls()
@@ -395,13 +843,16 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(options_box)
 
         action_hint = QtWidgets.QLabel("Primary actions are in the top bar.")
-        action_hint.setObjectName("CardSubtitle")
+        action_hint.setProperty("role", "card-subtitle")
         layout.addWidget(action_hint)
 
         logs_card, logs_layout = self._create_card("Run Log")
         self.log_view = QtWidgets.QPlainTextEdit()
-        self.log_view.setObjectName("LogView")
+        self.log_view.setProperty("role", "log-view")
         self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_view.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.log_view.customContextMenuRequested.connect(self._show_log_context_menu)
         logs_layout.addWidget(self.log_view, stretch=1)
         layout.addWidget(logs_card, stretch=1)
 
@@ -409,8 +860,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_qc_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), spacing=None, margin=2)
 
         card, card_layout = self._create_card("QC Gallery", "Generated plots from xenium_qc.")
         self.qc_scroll = QtWidgets.QScrollArea()
@@ -425,9 +875,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_analysis_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(10)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), margin=2)
 
         intro_card, intro_layout = self._create_card(
             "Analysis Controls",
@@ -444,9 +892,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.analysis_panel = QtWidgets.QWidget()
         self.analysis_panel.setVisible(True)
-        panel_layout = QtWidgets.QVBoxLayout(self.analysis_panel)
-        panel_layout.setContentsMargins(0, 0, 0, 0)
-        panel_layout.setSpacing(10)
+        panel_layout = self._tight(QtWidgets.QVBoxLayout(self.analysis_panel))
 
         graph_card, graph_layout = self._create_card(
             "Graph + UMAP",
@@ -458,25 +904,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.n_neighbors_spin = QtWidgets.QSpinBox()
         self.n_neighbors_spin.setRange(2, 200)
         self.n_neighbors_spin.setValue(15)
-        graph_form.addRow("Neighbors (n_neighbors)", self.n_neighbors_spin)
+        self._add_form_row(graph_form, "Neighbors (n_neighbors)", self.n_neighbors_spin)
 
         self.n_pcs_spin = QtWidgets.QSpinBox()
         self.n_pcs_spin.setRange(2, 200)
         self.n_pcs_spin.setValue(30)
-        graph_form.addRow("PCs (n_pcs)", self.n_pcs_spin)
+        self._add_form_row(graph_form, "PCs (n_pcs)", self.n_pcs_spin)
 
         self.umap_min_dist_spin = QtWidgets.QDoubleSpinBox()
         self.umap_min_dist_spin.setDecimals(3)
         self.umap_min_dist_spin.setRange(0.0, 1.0)
         self.umap_min_dist_spin.setSingleStep(0.05)
         self.umap_min_dist_spin.setValue(0.1)
-        graph_form.addRow("UMAP min_dist", self.umap_min_dist_spin)
+        self._add_form_row(graph_form, "UMAP min_dist", self.umap_min_dist_spin)
 
         self.cluster_graph_mode_combo = QtWidgets.QComboBox()
         self.cluster_graph_mode_combo.addItem("Auto (prefer spatial)", "auto")
         self.cluster_graph_mode_combo.addItem("Expression graph", "expression")
         self.cluster_graph_mode_combo.addItem("Spatial graph", "spatial")
-        graph_form.addRow("Graph source", self.cluster_graph_mode_combo)
+        self._add_form_row(graph_form, "Graph source", self.cluster_graph_mode_combo)
         graph_layout.addLayout(graph_form)
         panel_layout.addWidget(graph_card)
 
@@ -491,29 +937,36 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cluster_method_combo.addItem("Leiden", "leiden")
         self.cluster_method_combo.addItem("Louvain", "louvain")
         self.cluster_method_combo.addItem("KMeans", "kmeans")
-        cluster_form.addRow("Method", self.cluster_method_combo)
+        self._add_form_row(cluster_form, "Method", self.cluster_method_combo)
 
         self.leiden_res_edit = QtWidgets.QLineEdit("0.1,0.5,1,1.5,2")
         self.leiden_res_edit.setPlaceholderText("e.g. 0.5,1.0,1.5")
-        cluster_form.addRow("Leiden resolutions", self.leiden_res_edit)
+        self._add_form_row(cluster_form, "Leiden resolutions", self.leiden_res_edit)
 
         self.louvain_res_edit = QtWidgets.QLineEdit("0.5,1.0")
         self.louvain_res_edit.setPlaceholderText("e.g. 0.5,1.0")
-        cluster_form.addRow("Louvain resolutions", self.louvain_res_edit)
+        self._add_form_row(cluster_form, "Louvain resolutions", self.louvain_res_edit)
 
         self.kmeans_clusters_edit = QtWidgets.QLineEdit("8,12")
         self.kmeans_clusters_edit.setPlaceholderText("e.g. 8,12,16")
-        cluster_form.addRow("KMeans k values", self.kmeans_clusters_edit)
+        self._add_form_row(cluster_form, "KMeans k values", self.kmeans_clusters_edit)
+
+        for sweep_edit, cast in (
+            (self.leiden_res_edit, float),
+            (self.louvain_res_edit, float),
+            (self.kmeans_clusters_edit, int),
+        ):
+            self._bind_sweep_edit(sweep_edit, cast)
 
         self.kmeans_random_state_spin = QtWidgets.QSpinBox()
         self.kmeans_random_state_spin.setRange(0, 999999)
         self.kmeans_random_state_spin.setValue(0)
-        cluster_form.addRow("KMeans random_state", self.kmeans_random_state_spin)
+        self._add_form_row(cluster_form, "KMeans random_state", self.kmeans_random_state_spin)
 
         self.kmeans_n_init_spin = QtWidgets.QSpinBox()
         self.kmeans_n_init_spin.setRange(1, 50)
         self.kmeans_n_init_spin.setValue(10)
-        cluster_form.addRow("KMeans n_init", self.kmeans_n_init_spin)
+        self._add_form_row(cluster_form, "KMeans n_init", self.kmeans_n_init_spin)
 
         cluster_layout.addLayout(cluster_form)
         panel_layout.addWidget(cluster_card)
@@ -528,6 +981,37 @@ class MainWindow(QtWidgets.QMainWindow):
         self._sync_cluster_controls()
         return widget
 
+    def _bind_sweep_edit(self, edit: QtWidgets.QLineEdit, cast: Callable[[str], object]) -> None:
+        # The validated list is cached on the widget and only re-parsed after an edit.
+        edit.textChanged.connect(lambda _text, e=edit: e.setProperty("parsed", None))
+        edit.editingFinished.connect(partial(self._sweep_arg, edit, cast, ""))
+        self._sweep_arg(edit, cast, "")
+
+    @staticmethod
+    def _parse_sweep_text(text: str, cast: Callable[[str], object]) -> Optional[str]:
+        # Tokens are kept verbatim: the pipeline names obs keys after them (leiden_1.0).
+        tokens = [token.strip() for token in text.split(",") if token.strip()]
+        try:
+            for token in tokens:
+                cast(token)
+        except ValueError:
+            return None
+        return ",".join(tokens)
+
+    def _sweep_arg(
+        self,
+        edit: QtWidgets.QLineEdit,
+        cast: Callable[[str], object],
+        default: str,
+    ) -> Optional[str]:
+        parsed = edit.property("parsed")
+        if parsed is None:
+            parsed = self._parse_sweep_text(edit.text(), cast)
+            if parsed is None:
+                return None
+            edit.setProperty("parsed", parsed)
+        return parsed or default
+
     def _toggle_analysis_panel(self, checked: bool) -> None:
         self.analysis_panel.setVisible(checked)
         self.analysis_toggle_btn.setArrowType(QtCore.Qt.DownArrow if checked else QtCore.Qt.RightArrow)
@@ -554,8 +1038,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_spatial_static_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), spacing=None, margin=2)
 
         card, card_layout = self._create_card(
             "Spatial Map (Static)",
@@ -565,7 +1048,7 @@ class MainWindow(QtWidgets.QMainWindow):
         controls_row = QtWidgets.QHBoxLayout()
         controls_row.setSpacing(10)
         key_label = QtWidgets.QLabel("Color key")
-        key_label.setObjectName("CardSubtitle")
+        key_label.setProperty("role", "card-subtitle")
         self.spatial_key_combo = QtWidgets.QComboBox()
         self.spatial_key_combo.addItem("Auto (cluster key)", "")
         self.spatial_key_combo.setEnabled(False)
@@ -577,7 +1060,7 @@ class MainWindow(QtWidgets.QMainWindow):
         card_layout.addLayout(controls_row)
 
         self.spatial_static_label = QtWidgets.QLabel("No spatial map found. Click Generate Spatial Map.")
-        self.spatial_static_label.setObjectName("PreviewSurface")
+        self.spatial_static_label.setProperty("role", "preview-surface")
         self.spatial_static_label.setAlignment(QtCore.Qt.AlignCenter)
         self.spatial_static_label.setMinimumHeight(260)
         card_layout.addWidget(self.spatial_static_label, stretch=1)
@@ -586,19 +1069,31 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_spatial_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), spacing=None, margin=2)
 
         card, card_layout = self._create_card(
             "Spatial Map (Interactive)",
             "KaroSpace viewer output for section-level inspection.",
         )
 
-        if WEB_AVAILABLE:
-            self.spatial_view = QWebEngineView()
-            card_layout.addWidget(self.spatial_view, stretch=1)
+        # QtWebEngine loads Chromium; import it only when this page is opened.
+        try:
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+            self._web_available = True
+        except Exception:
+            self._web_available = False
+
+        self.spatial_view = None
+        if self._web_available:
+            # The view (and its renderer process) is created on first load of real HTML.
+            self._web_view_cls = QWebEngineView
+            self._spatial_card_layout = card_layout
+            self.spatial_placeholder_label = QtWidgets.QLabel(
+                "No KaroSpace HTML found. Run with export enabled."
+            )
+            self.spatial_placeholder_label.setAlignment(QtCore.Qt.AlignCenter)
+            card_layout.addWidget(self.spatial_placeholder_label, stretch=1)
         else:
-            self.spatial_view = None
             self.spatial_fallback_label = QtWidgets.QLabel(
                 "Qt WebEngine not available. Spatial viewer will open in your browser."
             )
@@ -609,17 +1104,17 @@ class MainWindow(QtWidgets.QMainWindow):
             card_layout.addWidget(self.spatial_open_btn)
 
         layout.addWidget(card, stretch=1)
+        self._spatial_page = widget
         return widget
 
     def _build_umap_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), spacing=None, margin=2)
 
         card, card_layout = self._create_card("UMAP", "Top bar action: Generate UMAP.")
         key_row = QtWidgets.QHBoxLayout()
         key_label = QtWidgets.QLabel("Cluster key")
-        key_label.setObjectName("CardSubtitle")
+        key_label.setProperty("role", "card-subtitle")
         self.umap_key_combo = QtWidgets.QComboBox()
         self.umap_key_combo.addItem("Auto (cluster key)", "")
         self.umap_key_combo.setEnabled(False)
@@ -631,7 +1126,7 @@ class MainWindow(QtWidgets.QMainWindow):
         card_layout.addLayout(key_row)
 
         self.umap_label = QtWidgets.QLabel("No UMAP image loaded.")
-        self.umap_label.setObjectName("PreviewSurface")
+        self.umap_label.setProperty("role", "preview-surface")
         self.umap_label.setAlignment(QtCore.Qt.AlignCenter)
         self.umap_label.setMinimumHeight(260)
         card_layout.addWidget(self.umap_label, stretch=1)
@@ -640,8 +1135,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_compartment_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), spacing=None, margin=2)
 
         card, card_layout = self._create_card(
             "Compartment Map",
@@ -649,7 +1143,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         key_row = QtWidgets.QHBoxLayout()
         key_label = QtWidgets.QLabel("Compartment key")
-        key_label.setObjectName("CardSubtitle")
+        key_label.setProperty("role", "card-subtitle")
         self.compartment_key_combo = QtWidgets.QComboBox()
         self.compartment_key_combo.addItem("Auto (primary)", "")
         self.compartment_key_combo.setEnabled(False)
@@ -660,7 +1154,7 @@ class MainWindow(QtWidgets.QMainWindow):
         key_row.addWidget(self.generate_compartment_btn)
         card_layout.addLayout(key_row)
         self.compartment_label = QtWidgets.QLabel("No compartment map loaded.")
-        self.compartment_label.setObjectName("PreviewSurface")
+        self.compartment_label.setProperty("role", "preview-surface")
         self.compartment_label.setAlignment(QtCore.Qt.AlignCenter)
         self.compartment_label.setMinimumHeight(260)
         card_layout.addWidget(self.compartment_label, stretch=1)
@@ -669,8 +1163,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_gene_expression_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
+        layout = self._tight(QtWidgets.QVBoxLayout(widget), spacing=None, margin=2)
 
         card, card_layout = self._create_card(
             "Gene Expression Dotplot",
@@ -680,13 +1173,13 @@ class MainWindow(QtWidgets.QMainWindow):
         controls_row.setSpacing(10)
 
         key_label = QtWidgets.QLabel("Group by")
-        key_label.setObjectName("CardSubtitle")
+        key_label.setProperty("role", "card-subtitle")
         self.gene_expr_key_combo = QtWidgets.QComboBox()
         self.gene_expr_key_combo.addItem("Auto (cluster key)", "")
         self.gene_expr_key_combo.setEnabled(False)
 
         top_n_label = QtWidgets.QLabel("Top genes")
-        top_n_label.setObjectName("CardSubtitle")
+        top_n_label.setProperty("role", "card-subtitle")
         self.gene_expr_top_n_spin = QtWidgets.QSpinBox()
         self.gene_expr_top_n_spin.setRange(1, 50)
         self.gene_expr_top_n_spin.setValue(10)
@@ -702,7 +1195,7 @@ class MainWindow(QtWidgets.QMainWindow):
         card_layout.addLayout(controls_row)
 
         self.gene_expr_label = QtWidgets.QLabel("No dotplot loaded.")
-        self.gene_expr_label.setObjectName("PreviewSurface")
+        self.gene_expr_label.setProperty("role", "preview-surface")
         self.gene_expr_label.setAlignment(QtCore.Qt.AlignCenter)
         self.gene_expr_label.setMinimumHeight(260)
         card_layout.addWidget(self.gene_expr_label, stretch=1)
@@ -710,7 +1203,7 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(card, stretch=1)
         return widget
 
-    def _choose_dir(self, line_edit: QtWidgets.QLineEdit) -> None:
+    def _choose_dir(self, line_edit: QtWidgets.QLineEdit, _checked: bool = False) -> None:
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select directory")
         if path:
             line_edit.setText(path)
@@ -726,28 +1219,80 @@ class MainWindow(QtWidgets.QMainWindow):
             self.karospace_path_edit.setText(path)
 
     def _log(self, message: str) -> None:
+        self._log_lines([message])
+
+    def _log_lines(self, messages: List[str]) -> None:
+        # Lines are queued and appended as one block on the next event-loop pass,
+        # so a burst of pipeline output costs a single document layout.
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_view.appendPlainText(f"[{timestamp}] {message}")
+        for message in messages:
+            line = f"[{timestamp}] {message}"
+            if len(message) > LOG_MAX_LINE:
+                # Very long paragraphs make QTextDocument layout superlinear; show a prefix only.
+                self._log_ring.append(line)
+                self._log_elided_count += 1
+                line = (
+                    f"[{timestamp}] {message[:LOG_MAX_LINE]} "
+                    f"...(+{len(message) - LOG_MAX_LINE} chars, #{self._log_elided_count})"
+                )
+            self._log_pending.append(line)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_pending:
+            return
+        self.log_view.appendPlainText("\n".join(self._log_pending))
+        self._log_pending.clear()
+
+    def _full_log_line(self, number: int) -> Optional[str]:
+        # Elided lines are numbered 1, 2, ...; the ring holds the most recent LOG_RING_SIZE of them.
+        index = number - (self._log_elided_count - len(self._log_ring)) - 1
+        if 0 <= index < len(self._log_ring):
+            return self._log_ring[index]
+        return None
+
+    def _show_log_context_menu(self, pos: QtCore.QPoint) -> None:
+        menu = self.log_view.createStandardContextMenu()
+        elided = _LOG_ELIDED_RE.search(self.log_view.cursorForPosition(pos).block().text())
+        menu.addSeparator()
+        action = menu.addAction("Show full line...")
+        action.setEnabled(elided is not None)
+        chosen = menu.exec(self.log_view.viewport().mapToGlobal(pos))
+        menu.deleteLater()
+        if chosen is not action or elided is None:
+            return
+        full_line = self._full_log_line(int(elided.group(1)))
+        if full_line is None:
+            QtWidgets.QMessageBox.information(
+                self,
+                "Full log line",
+                f"This line is no longer available; only the last {LOG_RING_SIZE} long lines are kept.",
+            )
+        else:
+            msg = QtWidgets.QMessageBox(self)
+            msg.setWindowTitle("Full log line")
+            msg.setText(f"Log line ({len(full_line)} characters). Expand the details to read it.")
+            msg.setDetailedText(full_line)
+            msg.exec()
 
     def _collect_existing_pipeline_outputs(
         self,
         out_dir: Path,
         karospace_path: Optional[Path],
     ) -> List[Path]:
-        candidates = [
-            out_dir / "data" / "raw.h5ad",
-            out_dir / "data" / "clustered.h5ad",
-            out_dir / "data" / "cluster_info.json",
-            out_dir / "data" / "markers_by_cluster.csv",
-            out_dir / "xenium_qc" / "summary_by_run.csv",
-            out_dir / "xenium_qc" / "gene_detection_overall.csv",
-            out_dir / "plots" / "spatial.png",
-            out_dir / "plots" / "umap.png",
-            out_dir / "plots" / "compartments.png",
-        ]
-        if karospace_path is not None:
-            candidates.append(karospace_path)
-        return [p for p in candidates if p.exists()]
+        existing: List[Path] = []
+        for subdir, names in self._PIPELINE_OUTPUTS:
+            folder = out_dir / subdir
+            try:
+                with os.scandir(folder) as scan:
+                    present = {entry.name for entry in scan}
+            except OSError:
+                continue
+            existing.extend(folder / name for name in names if name in present)
+        if karospace_path is not None and karospace_path.exists():
+            existing.append(karospace_path)
+        return existing
 
     def _confirm_overwrite(
         self,
@@ -758,10 +1303,11 @@ class MainWindow(QtWidgets.QMainWindow):
     ) -> bool:
         if not paths:
             return True
-        shown = [str(p) for p in paths[:10]]
-        details = "\n".join(shown)
-        if len(paths) > 10:
-            details += f"\n... and {len(paths) - 10} more"
+        # Only the listed paths are stringified; the rest are summarised by count.
+        details = "\n".join(map(str, paths[:OVERWRITE_DETAIL_LIMIT]))
+        hidden = len(paths) - OVERWRITE_DETAIL_LIMIT
+        if hidden > 0:
+            details += f"\n... and {hidden} more"
 
         msg = QtWidgets.QMessageBox(self)
         msg.setIcon(QtWidgets.QMessageBox.Warning)
@@ -799,16 +1345,22 @@ class MainWindow(QtWidgets.QMainWindow):
             self.runner_glyph.setText("   ")
             self.status_chip.setText("Ready")
             return
-        frame = self._runner_frames[self._busy_tick % len(self._runner_frames)]
-        self.runner_glyph.setText(frame)
-        self.status_chip.setText("Running")
-        self._busy_tick += 1
+        frames = self._runner_frames
+        self.runner_glyph.setText(frames[self._busy_tick])
+        # Four frames, so masking with 3 wraps the index without a modulo.
+        self._busy_tick = (self._busy_tick + 1) & 3
+        if self.status_chip.text() != "Running":
+            self.status_chip.setText("Running")
 
     def _set_activity_stage(self, text: str) -> None:
         # Keep top bar width stable while still showing useful per-step status.
-        fm = self.activity_stage.fontMetrics()
-        elided = fm.elidedText(text, QtCore.Qt.ElideRight, self.activity_stage.width() or 240)
-        self.activity_stage.setText(elided)
+        width = self.activity_stage.width() or 240
+        if (text, width) == self._activity_stage_state:
+            return
+        self._activity_stage_state = (text, width)
+        if self._activity_fm is None:
+            self._activity_fm = QtGui.QFontMetrics(self.activity_stage.font())
+        self.activity_stage.setText(self._activity_fm.elidedText(text, QtCore.Qt.ElideRight, width))
         self.activity_stage.setToolTip(text)
 
     def _update_stage_from_log(self, line: str) -> None:
@@ -818,22 +1370,11 @@ class MainWindow(QtWidgets.QMainWindow):
             self._set_activity_stage(stage_text)
             return
 
-        stage_map = [
-            ("Loading run:", "Loading runs"),
-            ("Saved raw AnnData:", "Preparing QC"),
-            ("Saved QC outputs:", "QC complete"),
-            ("Running MANA weighted aggregation...", "MANA aggregation"),
-            ("Saved clustered AnnData:", "Saving clustered data"),
-            ("Exporting KaroSpace HTML...", "Exporting KaroSpace"),
-        ]
-        for token, stage_text in stage_map:
-            if token in line:
-                self._busy_base_text = stage_text
-                self._set_activity_stage(stage_text)
-                return
-
-    def _theme_path(self) -> Path:
-        return THEME_DARK_PATH if self._theme_mode == "dark" else THEME_LIGHT_PATH
+        match = self._STAGE_PATTERN.search(line)
+        if match is not None:
+            stage_text = self._STAGE_MAP[match.group(0)]
+            self._busy_base_text = stage_text
+            self._set_activity_stage(stage_text)
 
     def _detect_system_theme(self) -> str:
         app = QtWidgets.QApplication.instance()
@@ -842,17 +1383,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
         style_hints = app.styleHints()
         color_scheme = getattr(style_hints, "colorScheme", lambda: None)()
-        dark_enum = getattr(getattr(QtCore.Qt, "ColorScheme", object), "Dark", None)
-        light_enum = getattr(getattr(QtCore.Qt, "ColorScheme", object), "Light", None)
-        if dark_enum is not None and color_scheme == dark_enum:
-            return "dark"
-        if light_enum is not None and color_scheme == light_enum:
-            return "light"
+        mode = self._scheme_mode(color_scheme)
+        if mode is not None:
+            return mode
 
         # Fallback for environments without colorScheme support.
         bg = app.palette().color(QtGui.QPalette.Window)
         return "dark" if bg.lightness() < 128 else "light"
 
+    @classmethod
+    def _scheme_mode(cls, color_scheme: object) -> Optional[str]:
+        return cls._COLOR_SCHEME_MODES.get(color_scheme) if color_scheme is not None else None
+
     def _connect_system_theme_signal(self) -> None:
         app = QtWidgets.QApplication.instance()
         if app is None:
@@ -867,19 +1409,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self._theme_mode = "dark" if checked else "light"
         self._apply_theme(self._theme_mode)
 
-    def _on_system_color_scheme_changed(self, _scheme: object) -> None:
+    def _on_system_color_scheme_changed(self, scheme: object) -> None:
         if self._manual_theme_override:
             return
-        self._apply_theme(self._detect_system_theme())
+        # The signal already carries the new scheme; only Unknown needs the palette probe.
+        self._apply_theme(self._scheme_mode(scheme) or self._detect_system_theme())
 
     def _apply_theme(self, mode: Optional[str] = None) -> None:
         if mode in {"light", "dark"}:
             self._theme_mode = mode
+        # Spurious colorSchemeChanged signals must not trigger an app-wide re-polish.
+        if self._theme_mode == self._theme_mode_applied:
+            return
         app = QtWidgets.QApplication.instance()
-        theme_path = self._theme_path()
-        if app is None or not theme_path.exists():
+        qss = _get_theme_qss(self._theme_mode)
+        if app is None or qss is None:
             return
-        app.setStyleSheet(theme_path.read_text())
+        if qss != self._current_qss:
+            app.setStyleSheet(qss)
+            self._current_qss = qss
+            # A new stylesheet may change the stage label font; re-measure on next update.
+            self._activity_fm = None
+            self._activity_stage_state = None
+        self._theme_mode_applied = self._theme_mode
         self.theme_toggle_btn.blockSignals(True)
         self.theme_toggle_btn.setChecked(self._theme_mode == "dark")
         self.theme_toggle_btn.setText("Light" if self._theme_mode == "dark" else "Dark")
@@ -896,68 +1448,43 @@ class MainWindow(QtWidgets.QMainWindow):
         out_dir_path = Path(out_dir).expanduser().resolve()
         karospace_path_obj: Optional[Path] = None
 
-        args = [
-            sys.executable,
-            "-u",
-            str(ROOT_DIR / "run_xenium_analysis.py"),
-            "--data-dir",
-            data_dir,
-            "--out-dir",
-            out_dir,
-            "--run-prefix",
-            self.run_prefix_edit.text().strip() or "output-",
-            "--run-search-depth",
-            str(self.run_search_depth_combo.currentData()),
-            "--sample-id-source",
-            str(self.sample_id_source_combo.currentData()),
-            "--count-matrix-mode",
-            str(self.count_matrix_mode_combo.currentData()),
-            "--n-neighbors",
-            str(self.n_neighbors_spin.value()),
-            "--n-pcs",
-            str(self.n_pcs_spin.value()),
-            "--umap-min-dist",
-            str(self.umap_min_dist_spin.value()),
-            "--cluster-graph-mode",
-            str(self.cluster_graph_mode_combo.currentData()),
-            "--cluster-method",
-            str(self.cluster_method_combo.currentData()),
+        cluster_method = str(self.cluster_method_combo.currentData())
+        sweep_args: dict[str, str] = {}
+        for method, edit, cast, default, label in (
+            ("leiden", self.leiden_res_edit, float, "0.1,0.5,1,1.5,2", "Leiden resolutions"),
+            ("louvain", self.louvain_res_edit, float, "0.5,1.0", "Louvain resolutions"),
+            ("kmeans", self.kmeans_clusters_edit, int, "8,12", "KMeans k values"),
+        ):
+            value = self._sweep_arg(edit, cast, default)
+            if value is None:
+                if method == cluster_method:
+                    QtWidgets.QMessageBox.warning(
+                        self,
+                        "Invalid sweep values",
+                        f"{label} must be a comma-separated list of numbers.",
+                    )
+                    return
+                # Inactive methods are not parsed by the pipeline; pass them through.
+                value = edit.text().strip() or default
+            sweep_args[method] = value
+
+        args = [sys.executable, "-u", str(ROOT_DIR / "run_xenium_analysis.py")]
+        args += self._spec_args(self._ARG_SPECS)
+        args += [
             "--leiden-resolutions",
-            self.leiden_res_edit.text().strip() or "0.1,0.5,1,1.5,2",
+            sweep_args["leiden"],
             "--louvain-resolutions",
-            self.louvain_res_edit.text().strip() or "0.5,1.0",
+            sweep_args["louvain"],
             "--kmeans-clusters",
-            self.kmeans_clusters_edit.text().strip() or "8,12",
-            "--kmeans-random-state",
-            str(self.kmeans_random_state_spin.value()),
-            "--kmeans-n-init",
-            str(self.kmeans_n_init_spin.value()),
+            sweep_args["kmeans"],
         ]
 
         if str(self.count_matrix_mode_combo.currentData()) == "nucleus_or_distance":
-            args += [
-                "--tx-max-distance-um",
-                str(self.tx_max_distance_spin.value()),
-                "--tx-nucleus-distance-key",
-                self.tx_nucleus_distance_key_edit.text().strip() or "nucleus_distance",
-                "--tx-allowed-categories",
-                self.tx_allowed_categories_edit.text().strip() or "predesigned_gene,custom_gene",
-            ]
+            args += self._spec_args(self._TX_ARG_SPECS)
 
         if self.mana_check.isChecked():
-            rep_mode = str(self.mana_rep_mode.currentData())
-            args += [
-                "--mana-aggregate",
-                "--mana-n-layers",
-                str(self.mana_layers.value()),
-                "--mana-hop-decay",
-                str(self.mana_hop_decay.value()),
-                "--mana-distance-kernel",
-                self.mana_kernel.currentText(),
-                "--mana-representation-mode",
-                rep_mode,
-            ]
-            if rep_mode == "custom":
+            args += ["--mana-aggregate", *self._spec_args(self._MANA_ARG_SPECS)]
+            if str(self.mana_rep_mode.currentData()) == "custom":
                 custom_rep = self.mana_custom_rep_edit.text().strip()
                 if not custom_rep:
                     QtWidgets.QMessageBox.warning(
@@ -976,40 +1503,110 @@ class MainWindow(QtWidgets.QMainWindow):
             karospace_path_obj = Path(karospace_path).expanduser().resolve()
             args += ["--karospace-html", karospace_path]
 
-        existing_outputs = self._collect_existing_pipeline_outputs(
-            out_dir=out_dir_path,
-            karospace_path=karospace_path_obj,
-        )
-        if not self._confirm_overwrite(
-            existing_outputs,
-            title="Existing outputs found",
-            prompt="Run pipeline and overwrite existing outputs?",
+        run_signature = tuple(args)
+        if self._last_run is not None and self._last_run == (
+            run_signature,
+            _scan_signature(out_dir_path, _scan_output_files(out_dir_path)),
         ):
-            self._log("Run cancelled by user (existing outputs).")
-            return
-
+            # Same settings and untouched outputs since the last successful run.
+            choice = self._confirm_rerun()
+            if choice == "load":
+                self._load_outputs(Path(out_dir))
+                self._update_recent()
+                return
+            if choice != "run":
+                self._log("Run cancelled by user (outputs up to date).")
+                return
+        else:
+            existing_outputs = self._collect_existing_pipeline_outputs(
+                out_dir=out_dir_path,
+                karospace_path=karospace_path_obj,
+            )
+            if not self._confirm_overwrite(
+                existing_outputs,
+                title="Existing outputs found",
+                prompt="Run pipeline and overwrite existing outputs?",
+            ):
+                self._log("Run cancelled by user (existing outputs).")
+                return
+        self._running_signature = run_signature
         self._log("Starting pipeline...")
         self._enter_busy("Running pipeline")
         self.top_run_btn.setEnabled(False)
+        self._pipeline_args = args
+        if self._plot_process_queue:
+            self._log(f"Skipping {len(self._plot_process_queue)} queued plot(s) for the pipeline run.")
+            self._plot_process_queue.clear()
+        # Backed AnnData keeps clustered.h5ad open; HDF5 locking would block the pipeline's write.
+        # Always queued: a plot or the module import may still be in flight on the worker, and
+        # the release runs behind it, so the run starts once the file is really closed.
+        self._next_job_id += 1
+        self._adata_release = _Task(self._next_job_id, self._release_adata_cache)
+        self._adata_release.signals.finished.connect(self._on_adata_released)
+        self._plot_pool.start(self._adata_release)
+
+    def _on_adata_released(self, _job_id: int, _result: object, error: str) -> None:
+        self._adata_release = None
+        if error:
+            self._log(f"Releasing cached plot data failed ({error})")
+        self._start_pipeline_when_idle()
+
+    def _start_pipeline_when_idle(self) -> None:
+        # Called once the cache release (queued behind any plot job) and each plot process
+        # finish; the last of them to let go of clustered.h5ad starts the run.
+        if self._pipeline_args is None or self._adata_release is not None or self._plot_processes:
+            return
+        args = self._pipeline_args
+        self._pipeline_args = None
+        self._stdout_buffer = _LineBuffer()
         self.process = QtCore.QProcess(self)
         self.process.setProgram(args[0])
         self.process.setArguments(args[1:])
         self.process.setWorkingDirectory(str(ROOT_DIR))
         self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
-        self.process.readyReadStandardOutput.connect(self._on_process_output)
+        self.process.readyReadStandardOutput.connect(self._schedule_process_read)
         self.process.finished.connect(self._on_process_finished)
         self.process.start()
 
-    def _on_process_output(self) -> None:
+    def _spec_args(self, specs: Tuple[Tuple[str, Callable[["MainWindow"], str]], ...]) -> List[str]:
+        return [value for flag, getter in specs for value in (flag, getter(self))]
+
+    def _confirm_rerun(self) -> str:
+        msg = QtWidgets.QMessageBox(self)
+        msg.setIcon(QtWidgets.QMessageBox.Question)
+        msg.setWindowTitle("Outputs up to date")
+        msg.setText("The last run used these exact settings and its outputs are unchanged.")
+        msg.setInformativeText("Load the existing outputs instead of running again?")
+        load_btn = msg.addButton("Load Outputs", QtWidgets.QMessageBox.AcceptRole)
+        run_btn = msg.addButton("Run Again", QtWidgets.QMessageBox.DestructiveRole)
+        msg.addButton(QtWidgets.QMessageBox.Cancel)
+        msg.setDefaultButton(load_btn)
+        msg.exec()
+        clicked = msg.clickedButton()
+        if clicked is load_btn:
+            return "load"
+        if clicked is run_btn:
+            return "run"
+        return "cancel"
+
+    def _schedule_process_read(self) -> None:
+        if not self._process_read_timer.isActive():
+            self._process_read_timer.start()
+
+    def _drain_process_output(self) -> None:
         if not self.process:
             return
-        text = self.process.readAllStandardOutput().data().decode("utf-8", errors="ignore")
-        for line in text.splitlines():
-            if line.strip():
-                self._log(line)
-                self._update_stage_from_log(line)
+        self._handle_process_lines(self._stdout_buffer.feed(self.process.readAllStandardOutput().data()))
+
+    def _handle_process_lines(self, lines: List[str]) -> None:
+        for line in lines:
+            self._update_stage_from_log(line)
+        self._log_lines(lines)
 
     def _on_process_finished(self, exit_code: int, _status: QtCore.QProcess.ExitStatus) -> None:
+        self._process_read_timer.stop()
+        self._drain_process_output()
+        self._handle_process_lines(self._stdout_buffer.feed(b"", final=True))
         self.top_run_btn.setEnabled(True)
         self._log(f"Pipeline finished (exit code {exit_code}).")
         self._leave_busy(failed=exit_code != 0)
@@ -1017,6 +1614,10 @@ class MainWindow(QtWidgets.QMainWindow):
         if out_dir:
             self._load_outputs(Path(out_dir))
             self._update_recent()
+        self._last_run = None
+        if exit_code == 0 and self._running_signature is not None and self._out_dir_fingerprint:
+            self._last_run = (self._running_signature, self._out_dir_fingerprint[2])
+        self._running_signature = None
 
     def _load_outputs_only(self) -> None:
         out_dir = self.out_dir_edit.text().strip()
@@ -1029,178 +1630,207 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_recent()
 
     def _load_outputs(self, out_dir: Path) -> None:
+        scan = _scan_output_files(out_dir)
+        fingerprint = (
+            str(out_dir),
+            self.karospace_path_edit.text().strip(),
+            _scan_signature(out_dir, scan),
+        )
+        if out_dir == self.current_out_dir and fingerprint == self._out_dir_fingerprint:
+            return
         self.current_out_dir = out_dir
-        self._refresh_spatial_keys(out_dir)
-        self._refresh_umap_keys(out_dir)
-        self._refresh_compartment_keys(out_dir)
-        self._refresh_gene_expression_keys(out_dir)
-        self._load_qc_images(out_dir)
-        self._load_karospace(out_dir)
-        self._load_spatial_image(out_dir)
-        self._load_umap_image(out_dir)
-        self._load_compartment_image(out_dir)
-        self._load_gene_expression_image(out_dir)
-
-    def _refresh_spatial_keys(self, out_dir: Path) -> None:
-        keys: List[str] = []
-        cluster_info_path = out_dir / "data" / "cluster_info.json"
-        if cluster_info_path.exists():
-            try:
-                payload = json.loads(cluster_info_path.read_text())
-            except json.JSONDecodeError:
-                payload = {}
-
-            ordered_sources = [
-                payload.get("cluster_key"),
-                payload.get("compartment_key"),
-                payload.get("cluster_keys"),
-                payload.get("compartment_keys"),
-            ]
-            for source in ordered_sources:
-                if isinstance(source, list):
-                    candidates = source
-                else:
-                    candidates = [source]
-                for key in candidates:
-                    key_text = str(key or "").strip()
-                    if key_text and key_text not in keys:
-                        keys.append(key_text)
-
-        self.spatial_key_combo.blockSignals(True)
-        self.spatial_key_combo.clear()
-        self.spatial_key_combo.addItem("Auto (cluster key)", "")
-        for key in keys:
-            self.spatial_key_combo.addItem(key, key)
-        self.spatial_key_combo.setEnabled(bool(keys))
-        self.spatial_key_combo.blockSignals(False)
-
-    def _refresh_compartment_keys(self, out_dir: Path) -> None:
-        keys: List[str] = []
-        cluster_info_path = out_dir / "data" / "cluster_info.json"
-        if cluster_info_path.exists():
-            try:
-                payload = json.loads(cluster_info_path.read_text())
-            except json.JSONDecodeError:
-                payload = {}
-
-            raw_keys = payload.get("compartment_keys", [])
-            if isinstance(raw_keys, list):
-                for key in raw_keys:
-                    key_text = str(key).strip()
-                    if key_text and key_text not in keys:
-                        keys.append(key_text)
-
-            primary_key = str(payload.get("compartment_key") or "").strip()
-            if primary_key and primary_key not in keys:
-                keys.insert(0, primary_key)
-
-        self.compartment_key_combo.blockSignals(True)
-        self.compartment_key_combo.clear()
-        self.compartment_key_combo.addItem("Auto (primary)", "")
-        for key in keys:
-            self.compartment_key_combo.addItem(key, key)
-        self.compartment_key_combo.setEnabled(bool(keys))
-        self.compartment_key_combo.blockSignals(False)
+        self._out_dir_fingerprint = fingerprint
+        self._output_scan = scan
+        try:
+            # Pages that were never opened pick up outputs when they are built.
+            for index, loaders in self._page_loaders.items():
+                if index in self._pending_pages:
+                    continue
+                for loader in loaders:
+                    loader(out_dir)
+        finally:
+            self._output_scan = None
+        self._warm_visuals()
+
+    def _output_mtime(self, path: Path) -> Optional[int]:
+        if self._output_scan is not None and path.parent in self._output_scan:
+            stamp = self._output_scan.get(path)
+            return stamp[0] if stamp is not None else None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _key_combo_loader(
+        self, combo_name: str, source_names: Tuple[str, ...], auto_label: str
+    ) -> Callable[[Path], None]:
+        # The combo is looked up lazily: its page may not be built yet.
+        return lambda out_dir: self._refresh_key_combo(
+            getattr(self, combo_name), self._load_cluster_info(out_dir), source_names, auto_label
+        )
 
-    def _refresh_umap_keys(self, out_dir: Path) -> None:
-        keys: List[str] = []
+    def _load_cluster_info(self, out_dir: Path) -> dict:
+        # One parse per file version, shared by every key combo that needs it.
         cluster_info_path = out_dir / "data" / "cluster_info.json"
-        if cluster_info_path.exists():
-            try:
-                payload = json.loads(cluster_info_path.read_text())
-            except json.JSONDecodeError:
-                payload = {}
-
-            ordered_sources = [
-                payload.get("cluster_key"),
-                payload.get("cluster_keys"),
-                payload.get("compartment_key"),
-                payload.get("compartment_keys"),
-            ]
-            for source in ordered_sources:
-                if isinstance(source, list):
-                    candidates = source
-                else:
-                    candidates = [source]
-                for key in candidates:
-                    key_text = str(key or "").strip()
-                    if key_text and key_text not in keys:
-                        keys.append(key_text)
-
-        self.umap_key_combo.blockSignals(True)
-        self.umap_key_combo.clear()
-        self.umap_key_combo.addItem("Auto (cluster key)", "")
-        for key in keys:
-            self.umap_key_combo.addItem(key, key)
-        self.umap_key_combo.setEnabled(bool(keys))
-        self.umap_key_combo.blockSignals(False)
+        mtime_ns = self._output_mtime(cluster_info_path)
+        if mtime_ns is None:
+            return {}
+        cached = self._cluster_info_cache.get(cluster_info_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            payload = _load_cluster_info_keys(cluster_info_path)
+        except (OSError, ValueError):
+            payload = {}
+        self._cluster_info_cache[cluster_info_path] = (mtime_ns, payload)
+        return payload
+
+    @staticmethod
+    def _dedup_keys(payload: dict, source_names: Tuple[str, ...]) -> List[str]:
+        candidates: List[str] = []
+        for name in source_names:
+            source = payload.get(name)
+            for key in source if isinstance(source, list) else [source]:
+                key_text = str(key or "").strip()
+                if key_text:
+                    candidates.append(key_text)
+        return list(dict.fromkeys(candidates))
+
+    def _refresh_key_combo(
+        self,
+        combo: QtWidgets.QComboBox,
+        payload: dict,
+        source_names: Tuple[str, ...],
+        auto_label: str,
+    ) -> None:
+        keys = self._dedup_keys(payload, source_names)
+        # Build the rows off-view and swap the model in once instead of N row insertions.
+        model = QtGui.QStandardItemModel(len(keys) + 1, 1, combo)
+        for row, (label, data) in enumerate(zip([auto_label, *keys], ["", *keys])):
+            item = QtGui.QStandardItem(label)
+            item.setData(data, QtCore.Qt.UserRole)
+            model.setItem(row, 0, item)
+        combo.blockSignals(True)
+        # setModel() disposes of the previous model, which is parented to the combo.
+        combo.setModel(model)
+        combo.setCurrentIndex(0)
+        combo.setEnabled(bool(keys))
+        combo.blockSignals(False)
+
+    def _show_scaled_image(
+        self,
+        label: QtWidgets.QLabel,
+        path: Path,
+        missing_text: str,
+        width: int = QC_IMAGE_WIDTH,
+        fixed_size: bool = False,
+    ) -> None:
+        # Any older decode aimed at this label is now stale.
+        self._drop_image_jobs(label)
+        mtime_ns = self._output_mtime(path)
+        if mtime_ns is None:
+            label.setText(missing_text)
+            return
+        cache_key = (str(path), mtime_ns, width)
+        pixmap = self._pixmap_cache.get(cache_key)
+        if pixmap is not None:
+            self._apply_label_pixmap(label, pixmap, fixed_size)
+            return
 
-    def _refresh_gene_expression_keys(self, out_dir: Path) -> None:
-        keys: List[str] = []
-        cluster_info_path = out_dir / "data" / "cluster_info.json"
-        if cluster_info_path.exists():
-            try:
-                payload = json.loads(cluster_info_path.read_text())
-            except json.JSONDecodeError:
-                payload = {}
-
-            ordered_sources = [
-                payload.get("cluster_key"),
-                payload.get("cluster_keys"),
-                payload.get("compartment_key"),
-                payload.get("compartment_keys"),
-            ]
-            for source in ordered_sources:
-                if isinstance(source, list):
-                    candidates = source
-                else:
-                    candidates = [source]
-                for key in candidates:
-                    key_text = str(key or "").strip()
-                    if key_text and key_text not in keys:
-                        keys.append(key_text)
-
-        self.gene_expr_key_combo.blockSignals(True)
-        self.gene_expr_key_combo.clear()
-        self.gene_expr_key_combo.addItem("Auto (cluster key)", "")
-        for key in keys:
-            self.gene_expr_key_combo.addItem(key, key)
-        self.gene_expr_key_combo.setEnabled(bool(keys))
-        self.gene_expr_key_combo.blockSignals(False)
+        if fixed_size:
+            # Reserve the final row height from the header so the gallery does not jump.
+            target = _scaled_image_size(QtGui.QImageReader(str(path)), width)
+            if target is not None:
+                label.setFixedSize(target)
+            label.setText("Loading...")
+
+        self._next_job_id += 1
+        task = _Task(self._next_job_id, partial(_read_scaled_image, str(path), width))
+        task.signals.finished.connect(self._on_image_decoded)
+        self._image_jobs[task.job_id] = (task, cache_key, label, missing_text, fixed_size)
+        self._image_pool.start(task)
+
+    def _drop_image_jobs(self, label: QtWidgets.QLabel) -> None:
+        self._image_jobs = {
+            job_id: job for job_id, job in self._image_jobs.items() if job[2] is not label
+        }
+
+    @staticmethod
+    def _apply_label_pixmap(label: QtWidgets.QLabel, pixmap: QtGui.QPixmap, fixed_size: bool) -> None:
+        label.setPixmap(pixmap)
+        if fixed_size:
+            # Fixed rows: the gallery layout never has to re-query size hints.
+            label.setFixedSize(pixmap.size())
+
+    def _on_image_decoded(self, job_id: int, result: object, error: str) -> None:
+        job = self._image_jobs.pop(job_id, None)
+        if job is None:
+            return
+        _task, cache_key, label, missing_text, fixed_size = job
+        if error or not isinstance(result, QtGui.QImage) or result.isNull():
+            label.setText(missing_text)
+            return
+        pixmap = QtGui.QPixmap.fromImage(result)
+        self._store_pixmap(cache_key, pixmap)
+        self._apply_label_pixmap(label, pixmap, fixed_size)
+
+    def _store_pixmap(self, cache_key: Tuple[str, int, int], pixmap: QtGui.QPixmap) -> None:
+        # Keep only the newest version of each image at a given width.
+        self._pixmap_cache = {
+            key: value
+            for key, value in self._pixmap_cache.items()
+            if key[0] != cache_key[0] or key[2] != cache_key[2]
+        }
+        self._pixmap_cache[cache_key] = pixmap
 
     def _load_qc_images(self, out_dir: Path) -> None:
-        for i in reversed(range(self.qc_layout.count())):
-            item = self.qc_layout.takeAt(i)
-            if item and item.widget():
-                item.widget().deleteLater()
         qc_dir = out_dir / "xenium_qc"
-        if not qc_dir.exists():
-            self.qc_layout.addWidget(QtWidgets.QLabel("No QC outputs found."))
-            self.qc_layout.addStretch(1)
+        scan = self._output_scan if self._output_scan is not None else _scan_output_files(out_dir)
+        qc_dir_exists = qc_dir in scan
+        images: List[Tuple[str, int]] = sorted(
+            (str(path), stamp[0])
+            for path, stamp in scan.items()
+            if path.parent == qc_dir and path.suffix == ".png"
+        )
+        if images and list(self._qc_rows) == images:
             return
 
-        images = sorted(qc_dir.glob("*.png"))
+        # Detach everything, then re-add rows in order, reusing labels whose image is unchanged.
+        row_labels = set(self._qc_rows.values())
+        while self.qc_layout.count():
+            item = self.qc_layout.takeAt(0)
+            widget = item.widget() if item else None
+            if widget is not None and widget not in row_labels:
+                widget.deleteLater()
+        previous_rows = self._qc_rows
+        self._qc_rows = {}
+        current_keys = set(images)
+        for row_key, label in previous_rows.items():
+            if row_key not in current_keys:
+                self._drop_image_jobs(label)
+                label.deleteLater()
+
         if not images:
-            self.qc_layout.addWidget(QtWidgets.QLabel("No QC images found."))
+            message = "No QC images found." if qc_dir_exists else "No QC outputs found."
+            self.qc_layout.addWidget(QtWidgets.QLabel(message))
             self.qc_layout.addStretch(1)
             return
 
-        for img_path in images:
-            label = QtWidgets.QLabel()
-            label.setAlignment(QtCore.Qt.AlignCenter)
-            pixmap = QtGui.QPixmap(str(img_path))
-            if not pixmap.isNull():
-                label.setPixmap(pixmap.scaledToWidth(900, QtCore.Qt.SmoothTransformation))
-            else:
-                label.setText(str(img_path))
-            self.qc_layout.addWidget(label)
+        for row_key in images:
+            label = previous_rows.get(row_key)
+            if label is None:
+                label = QtWidgets.QLabel()
+                label.setAlignment(QtCore.Qt.AlignCenter)
+                self._show_scaled_image(label, Path(row_key[0]), row_key[0], fixed_size=True)
+            self._qc_rows[row_key] = label
+            self.qc_layout.addWidget(label, alignment=QtCore.Qt.AlignHCenter)
 
         self.qc_layout.addStretch(1)
 
     def _load_karospace(self, out_dir: Path) -> None:
         karospace_path = None
         candidate = out_dir / "karospace.html"
-        if candidate.exists():
+        if self._output_mtime(candidate) is not None:
             karospace_path = candidate
         elif self.karospace_path_edit.text().strip():
             path = Path(self.karospace_path_edit.text().strip())
@@ -1208,17 +1838,35 @@ class MainWindow(QtWidgets.QMainWindow):
                 karospace_path = path
 
         self.current_karospace_html = karospace_path
-        if WEB_AVAILABLE and self.spatial_view is not None:
-            if karospace_path:
-                self.spatial_view.load(QtCore.QUrl.fromLocalFile(str(karospace_path)))
-            else:
-                self.spatial_view.setHtml("<p>No KaroSpace HTML found. Run with export enabled.</p>")
-        elif not WEB_AVAILABLE:
+        if self._web_available:
+            # Loading is deferred until the page is on screen; see _show_pending_karospace.
+            self._pending_karospace = (
+                (str(karospace_path), self._output_mtime(karospace_path)) if karospace_path else None
+            )
+            if self.workspace_stack.currentWidget() is self._spatial_page:
+                self._show_pending_karospace()
+        else:
             if karospace_path:
                 self.spatial_fallback_label.setText(f"KaroSpace HTML: {karospace_path}")
             else:
                 self.spatial_fallback_label.setText("No KaroSpace HTML found. Run with export enabled.")
 
+    def _show_pending_karospace(self) -> None:
+        if self._web_view_cls is None or self._pending_karospace == self._shown_karospace:
+            return
+        self._shown_karospace = self._pending_karospace
+        if self._pending_karospace is None:
+            if self.spatial_view is not None:
+                self.spatial_view.hide()
+            self.spatial_placeholder_label.show()
+            return
+        if self.spatial_view is None:
+            self.spatial_view = self._web_view_cls()
+            self._spatial_card_layout.addWidget(self.spatial_view, stretch=1)
+        self.spatial_placeholder_label.hide()
+        self.spatial_view.show()
+        self.spatial_view.load(QtCore.QUrl.fromLocalFile(self._pending_karospace[0]))
+
     def _open_karospace_external(self) -> None:
         if not self.current_karospace_html or not self.current_karospace_html.exists():
             QtWidgets.QMessageBox.information(
@@ -1232,38 +1880,45 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
     def _load_spatial_image(self, out_dir: Path) -> None:
-        plot_path = out_dir / "plots" / "spatial.png"
-        if plot_path.exists():
-            pixmap = QtGui.QPixmap(str(plot_path))
-            self.spatial_static_label.setPixmap(pixmap.scaledToWidth(900, QtCore.Qt.SmoothTransformation))
-        else:
-            self.spatial_static_label.setText("No spatial map found. Click Generate Spatial Map.")
+        self._show_scaled_image(
+            self.spatial_static_label,
+            out_dir / "plots" / "spatial.png",
+            "No spatial map found. Click Generate Spatial Map.",
+        )
 
     def _load_umap_image(self, out_dir: Path) -> None:
-        plot_path = out_dir / "plots" / "umap.png"
-        if plot_path.exists():
-            pixmap = QtGui.QPixmap(str(plot_path))
-            self.umap_label.setPixmap(pixmap.scaledToWidth(900, QtCore.Qt.SmoothTransformation))
-        else:
-            self.umap_label.setText("No UMAP image found. Click Generate UMAP Plot.")
+        self._show_scaled_image(
+            self.umap_label,
+            out_dir / "plots" / "umap.png",
+            "No UMAP image found. Click Generate UMAP Plot.",
+        )
 
     def _load_compartment_image(self, out_dir: Path) -> None:
-        plot_path = out_dir / "plots" / "compartments.png"
-        if plot_path.exists():
-            pixmap = QtGui.QPixmap(str(plot_path))
-            self.compartment_label.setPixmap(pixmap.scaledToWidth(900, QtCore.Qt.SmoothTransformation))
-        else:
-            self.compartment_label.setText("No compartment map found. Click Generate Compartment Map.")
+        self._show_scaled_image(
+            self.compartment_label,
+            out_dir / "plots" / "compartments.png",
+            "No compartment map found. Click Generate Compartment Map.",
+        )
 
     def _load_gene_expression_image(self, out_dir: Path) -> None:
-        plot_path = out_dir / "plots" / "gene_expression_dotplot.png"
-        if plot_path.exists():
-            pixmap = QtGui.QPixmap(str(plot_path))
-            self.gene_expr_label.setPixmap(pixmap.scaledToWidth(900, QtCore.Qt.SmoothTransformation))
-        else:
-            self.gene_expr_label.setText("No gene expression dotplot found. Click Generate Dotplot.")
+        self._show_scaled_image(
+            self.gene_expr_label,
+            out_dir / "plots" / "gene_expression_dotplot.png",
+            "No gene expression dotplot found. Click Generate Dotplot.",
+        )
+
+    def _pipeline_blocks_plots(self) -> bool:
+        # From Run until the pipeline exits, clustered.h5ad is about to be or being rewritten.
+        if self._running_signature is None:
+            return False
+        QtWidgets.QMessageBox.information(
+            self, "Pipeline running", "Plots can be generated once the pipeline has finished."
+        )
+        return True
 
     def _generate_spatial_map(self) -> None:
+        if self._pipeline_blocks_plots():
+            return
         if not self.current_out_dir:
             QtWidgets.QMessageBox.warning(self, "Missing output", "Load outputs first.")
             return
@@ -1284,24 +1939,17 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log("Spatial map generation cancelled by user.")
             return
 
-        args = [
-            sys.executable,
-            "-u",
-            "-m",
-            "utils.app_visuals",
-            "spatial",
-            "--h5ad",
-            str(h5ad_path),
-            "--output",
-            str(output_path),
-        ]
         selected_key = str(self.spatial_key_combo.currentData() or "").strip()
-        if selected_key:
-            args += ["--color", selected_key]
-
-        self._run_visual_process(args, output_path, self.spatial_static_label)
+        self._run_visual_task(
+            "generate_spatial_map",
+            {"h5ad_path": h5ad_path, "output_path": output_path, "color": selected_key or None},
+            output_path,
+            self.spatial_static_label,
+        )
 
     def _generate_umap_plot(self) -> None:
+        if self._pipeline_blocks_plots():
+            return
         if not self.current_out_dir:
             QtWidgets.QMessageBox.warning(self, "Missing output", "Load outputs first.")
             return
@@ -1322,24 +1970,17 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log("UMAP generation cancelled by user.")
             return
 
-        args = [
-            sys.executable,
-            "-u",
-            "-m",
-            "utils.app_visuals",
-            "umap",
-            "--h5ad",
-            str(h5ad_path),
-            "--output",
-            str(output_path),
-        ]
         selected_key = str(self.umap_key_combo.currentData() or "").strip()
-        if selected_key:
-            args += ["--color", selected_key]
-
-        self._run_visual_process(args, output_path, self.umap_label)
+        self._run_visual_task(
+            "generate_umap_plot",
+            {"h5ad_path": h5ad_path, "output_path": output_path, "color": selected_key or None},
+            output_path,
+            self.umap_label,
+        )
 
     def _generate_compartment_map(self) -> None:
+        if self._pipeline_blocks_plots():
+            return
         if not self.current_out_dir:
             QtWidgets.QMessageBox.warning(self, "Missing output", "Load outputs first.")
             return
@@ -1360,24 +2001,17 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log("Compartment generation cancelled by user.")
             return
 
-        args = [
-            sys.executable,
-            "-u",
-            "-m",
-            "utils.app_visuals",
-            "compartments",
-            "--h5ad",
-            str(h5ad_path),
-            "--output",
-            str(output_path),
-        ]
         selected_key = str(self.compartment_key_combo.currentData() or "").strip()
-        if selected_key:
-            args += ["--color", selected_key]
-
-        self._run_visual_process(args, output_path, self.compartment_label)
+        self._run_visual_task(
+            "generate_compartment_map",
+            {"h5ad_path": h5ad_path, "output_path": output_path, "color": selected_key or None},
+            output_path,
+            self.compartment_label,
+        )
 
     def _generate_gene_expression_dotplot(self) -> None:
+        if self._pipeline_blocks_plots():
+            return
         if not self.current_out_dir:
             QtWidgets.QMessageBox.warning(self, "Missing output", "Load outputs first.")
             return
@@ -1398,69 +2032,222 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log("Gene expression dotplot generation cancelled by user.")
             return
 
+        selected_key = str(self.gene_expr_key_combo.currentData() or "").strip()
+        self._run_visual_task(
+            "generate_gene_expression_dotplot",
+            {
+                "h5ad_path": h5ad_path,
+                "output_path": output_path,
+                "groupby": selected_key or None,
+                "top_n": self.gene_expr_top_n_spin.value(),
+            },
+            output_path,
+            self.gene_expr_label,
+        )
+
+    def _generate_all_plots(self) -> None:
+        if self._pipeline_blocks_plots():
+            return
+        if not self.current_out_dir:
+            QtWidgets.QMessageBox.warning(self, "Missing output", "Load outputs first.")
+            return
+
+        h5ad_path = self.current_out_dir / "data" / "clustered.h5ad"
+        if not h5ad_path.exists():
+            QtWidgets.QMessageBox.warning(self, "Missing file", "clustered.h5ad not found.")
+            return
+
+        output_dir = self.current_out_dir / "plots"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        jobs: List[Tuple[str, str, Dict[str, object], str]] = []
+        for fn_name, command, file_name, label_attr, combo_attr, key_arg in self._PLOT_SPECS:
+            # Pages are built lazily; a plot whose page is not open yet uses its default key.
+            combo = getattr(self, combo_attr, None)
+            selected_key = str(combo.currentData() or "").strip() if combo is not None else ""
+            kwargs: Dict[str, object] = {
+                "h5ad_path": h5ad_path,
+                "output_path": output_dir / file_name,
+                key_arg: selected_key or None,
+            }
+            if command == "dotplot":
+                spin = getattr(self, "gene_expr_top_n_spin", None)
+                kwargs["top_n"] = spin.value() if spin is not None else 10
+            jobs.append((fn_name, command, kwargs, label_attr))
+
+        existing = [kwargs["output_path"] for _, _, kwargs, _ in jobs if kwargs["output_path"].exists()]
+        if not self._confirm_overwrite(
+            existing,
+            title="Existing plots found",
+            prompt="Regenerate all plots and overwrite existing files?",
+        ):
+            self._log("Plot generation cancelled by user.")
+            return
+
+        visuals = self._visuals_module
+        if visuals is not None and visuals.is_adata_cached(h5ad_path):
+            # The in-process worker already holds this AnnData; serial renders beat four reloads.
+            for fn_name, _command, kwargs, label_attr in jobs:
+                self._run_visual_task(
+                    fn_name, kwargs, kwargs["output_path"], getattr(self, label_attr, None)
+                )
+            return
+
+        # Cold start: each plot would wait on the same h5ad load, so overlap them in processes.
+        for _fn_name, command, kwargs, label_attr in jobs:
+            self._plot_process_queue.append(
+                (self._visual_cli_args(command, kwargs), kwargs["output_path"], label_attr)
+            )
+        self._start_plot_processes()
+
+    @staticmethod
+    def _visual_cli_args(command: str, kwargs: Dict[str, object]) -> List[str]:
         args = [
             sys.executable,
             "-u",
             "-m",
             "utils.app_visuals",
-            "dotplot",
+            command,
             "--h5ad",
-            str(h5ad_path),
+            str(kwargs["h5ad_path"]),
             "--output",
-            str(output_path),
-            "--top-n",
-            str(self.gene_expr_top_n_spin.value()),
+            str(kwargs["output_path"]),
         ]
-        selected_key = str(self.gene_expr_key_combo.currentData() or "").strip()
-        if selected_key:
-            args += ["--groupby", selected_key]
-
-        self._run_visual_process(args, output_path, self.gene_expr_label)
+        for key in ("color", "groupby"):
+            if kwargs.get(key):
+                args += [f"--{key}", str(kwargs[key])]
+        if "top_n" in kwargs:
+            args += ["--top-n", str(kwargs["top_n"])]
+        return args
+
+    def _start_plot_processes(self) -> None:
+        limit = min(PLOT_PROCESS_LIMIT, os.cpu_count() or 1)
+        while self._plot_process_queue and len(self._plot_processes) < limit:
+            args, output_path, label_attr = self._plot_process_queue.popleft()
+            self._log(f"Generating plot: {output_path.name}")
+            self._enter_busy(f"Generating {output_path.stem}")
+            proc = QtCore.QProcess(self)
+            proc.setProgram(args[0])
+            proc.setArguments(args[1:])
+            proc.setWorkingDirectory(str(ROOT_DIR))
+            proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+            self._next_job_id += 1
+            self._plot_processes[self._next_job_id] = (proc, output_path, label_attr, _LineBuffer())
+            proc.readyReadStandardOutput.connect(partial(self._on_plot_process_output, self._next_job_id))
+            proc.finished.connect(partial(self._on_plot_process_finished, self._next_job_id))
+            proc.start()
+
+    def _on_plot_process_output(self, job_id: int, final: bool = False) -> None:
+        job = self._plot_processes.get(job_id)
+        if job is None:
+            return
+        proc, _output_path, _label_attr, buffer = job
+        lines = buffer.feed(proc.readAllStandardOutput().data(), final=final)
+        if lines:
+            self._log_lines(lines)
 
-    def _run_visual_process(
+    def _on_plot_process_finished(
+        self, job_id: int, exit_code: int, status: QtCore.QProcess.ExitStatus
+    ) -> None:
+        # Flush the decoder and any unterminated last line before the job is dropped.
+        self._on_plot_process_output(job_id, final=True)
+        job = self._plot_processes.pop(job_id, None)
+        if job is None:
+            return
+        proc, output_path, label_attr, _buffer = job
+        proc.deleteLater()
+        if exit_code != 0 or status != QtCore.QProcess.NormalExit:
+            self._log(f"Plot generation failed: {output_path.name}")
+            self._leave_busy(failed=True)
+        else:
+            # Resolved now: the page may have been opened while the process ran.
+            label = getattr(self, label_attr, None)
+            if label is not None:
+                self._show_scaled_image(label, output_path, f"Plot not found: {output_path.name}")
+            self._log(f"Plot ready: {output_path.name}")
+            self._leave_busy(failed=False)
+        self._start_plot_processes()
+        self._start_pipeline_when_idle()
+
+    def _visuals(self) -> ModuleType:
+        # Imported on the plot worker so scanpy/matplotlib load off the GUI thread, once.
+        if self._visuals_module is None:
+            self._visuals_module = importlib.import_module("utils.app_visuals")
+        return self._visuals_module
+
+    def _warm_visuals(self) -> None:
+        # Pay the scanpy/matplotlib import and the first text draw on the idle plot worker
+        # before the first plot request.
+        if self._visuals_module is not None or self._visuals_warmup is not None:
+            return
+        self._next_job_id += 1
+        self._visuals_warmup = _Task(self._next_job_id, lambda: self._visuals().warm_renderer())
+        self._visuals_warmup.signals.finished.connect(self._on_visuals_warmed)
+        self._plot_pool.start(self._visuals_warmup)
+
+    def _on_visuals_warmed(self, _job_id: int, _result: object, error: str) -> None:
+        self._visuals_warmup = None
+        if error:
+            # The import is retried, and reported, by the first real plot job.
+            self._log(f"Plot module preload failed ({error})")
+
+    def _release_adata_cache(self) -> None:
+        # Runs on the plot worker, after any queued plot, so no job loses its file mid-read.
+        # Nothing to close when no plot has loaded the module yet.
+        if self._visuals_module is not None:
+            self._visuals_module.clear_adata_cache()
+
+    def _run_visual_task(
         self,
-        args: List[str],
+        fn_name: str,
+        kwargs: Dict[str, object],
         output_path: Path,
-        target_label: QtWidgets.QLabel,
+        target_label: Optional[QtWidgets.QLabel],
     ) -> None:
         self._log(f"Generating plot: {output_path.name}")
         self._enter_busy(f"Generating {output_path.stem}")
-        proc = QtCore.QProcess(self)
-        self._plot_processes.append(proc)
-        proc.setProgram(args[0])
-        proc.setArguments(args[1:])
-        proc.setWorkingDirectory(str(ROOT_DIR))
-        proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
-
-        def _on_plot_output() -> None:
-            text = proc.readAllStandardOutput().data().decode("utf-8", errors="ignore")
-            for line in text.splitlines():
-                if line.strip():
-                    self._log(line)
-
-        def _on_finished(exit_code: int, _status: QtCore.QProcess.ExitStatus) -> None:
-            if proc in self._plot_processes:
-                self._plot_processes.remove(proc)
-            if exit_code != 0:
-                self._log(f"Plot generation failed: {output_path.name}")
-                self._leave_busy(failed=True)
-                return
-            if output_path.exists():
-                pixmap = QtGui.QPixmap(str(output_path))
-                target_label.setPixmap(pixmap.scaledToWidth(900, QtCore.Qt.SmoothTransformation))
-            self._log(f"Plot ready: {output_path.name}")
-            self._leave_busy(failed=False)
 
-        proc.readyReadStandardOutput.connect(_on_plot_output)
-        proc.finished.connect(_on_finished)
-        proc.start()
+        def _job() -> QtGui.QImage:
+            # app_visuals keeps loaded AnnData cached across plots (see get_adata).
+            return _rgba_to_image(getattr(self._visuals(), fn_name)(**kwargs), QC_IMAGE_WIDTH)
+
+        self._next_job_id += 1
+        task = _Task(self._next_job_id, _job)
+        task.signals.finished.connect(self._on_plot_task_finished)
+        self._plot_jobs[task.job_id] = (task, output_path, target_label)
+        self._plot_pool.start(task)
+
+    def _on_plot_task_finished(self, job_id: int, result: object, error: str) -> None:
+        job = self._plot_jobs.pop(job_id, None)
+        if job is None:
+            return
+        _task, output_path, target_label = job
+        if error:
+            self._log(f"Plot generation failed: {output_path.name} ({error})")
+            self._leave_busy(failed=True)
+            return
+        mtime_ns = self._output_mtime(output_path)
+        if isinstance(result, QtGui.QImage) and not result.isNull() and mtime_ns is not None:
+            # The worker hands over pixels already scaled for display; the PNG is not decoded again.
+            pixmap = QtGui.QPixmap.fromImage(result)
+            # Without a label (page not built yet) the cached pixmap is what its loader will find.
+            self._store_pixmap((str(output_path), mtime_ns, QC_IMAGE_WIDTH), pixmap)
+            if target_label is not None:
+                self._drop_image_jobs(target_label)
+                target_label.setPixmap(pixmap)
+        elif mtime_ns is not None and target_label is not None:
+            self._show_scaled_image(target_label, output_path, f"Plot not found: {output_path.name}")
+        self._log(f"Plot ready: {output_path.name}")
+        self._leave_busy(failed=False)
 
     def _populate_recent(self) -> None:
+        # Rebuilding the list must not re-fill the path fields via selection signals.
+        self.recent_list.blockSignals(True)
         self.recent_list.clear()
         for project in sorted(self.recent_projects, key=lambda p: p.last_used, reverse=True):
             item = QtWidgets.QListWidgetItem(project.label())
             item.setData(QtCore.Qt.UserRole, project)
             self.recent_list.addItem(item)
+        self.recent_list.blockSignals(False)
 
     def _on_recent_selected(self) -> None:
         items = self.recent_list.selectedItems()
@@ -1502,12 +2289,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
 def main() -> None:
+    # Required for QtWebEngine when it is imported after the application exists.
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("InSituCore")
     app.setApplicationDisplayName("InSituCore")
     app.setOrganizationName("InSituCore")
-    if APP_ICON_PATH.exists():
-        app.setWindowIcon(QtGui.QIcon(str(APP_ICON_PATH)))
+    icon = _app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
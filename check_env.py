@@ -28,6 +28,8 @@ OPTIONAL_MODULES = [
     ("scvi", "scvi-tools"),
     ("cellcharter", "cellcharter"),
     ("PySide6.QtWebEngineWidgets", "PySide6-QtWebEngine"),
+    ("orjson", "orjson"),
+    ("ijson", "ijson"),
 ]
 
 
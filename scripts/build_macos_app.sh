@@ -19,6 +19,7 @@ mkdir -p "${OUT_DIR}"
 if [[ ! -f "${ICON_ICNS}" && -f "${ICON_GEN_SCRIPT}" ]]; then
   python3 "${ICON_GEN_SCRIPT}" || true
 fi
+bash "${REPO_ROOT}/scripts/build_qt_resources.sh" || true
 
 # Escape backslashes/quotes for JXA string literal.
 ESCAPED_LAUNCH_SCRIPT="${LAUNCH_SCRIPT//\\/\\\\}"
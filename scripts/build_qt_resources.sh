@@ -0,0 +1,31 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Compile app/resources.qrc (themes + app icon) into app/resources_rc.py.
+# The app falls back to reading files from disk when the module is missing.
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT="$(cd "${SCRIPT_DIR}/.." && pwd)"
+QRC_PATH="${REPO_ROOT}/app/resources.qrc"
+OUT_PATH="${REPO_ROOT}/app/resources_rc.py"
+ICON_1024="${REPO_ROOT}/assets/app_icon_1024.png"
+
+if [[ -x "${REPO_ROOT}/.venv/bin/pyside6-rcc" ]]; then
+  RCC_BIN="${REPO_ROOT}/.venv/bin/pyside6-rcc"
+elif command -v pyside6-rcc >/dev/null 2>&1; then
+  RCC_BIN="pyside6-rcc"
+else
+  echo "pyside6-rcc not found. Install PySide6 first." >&2
+  exit 1
+fi
+
+# Prefer the generated macOS icon when it exists, like the app does on disk.
+if [[ -f "${ICON_1024}" ]]; then
+  TMP_QRC="$(mktemp "${REPO_ROOT}/app/resources.XXXXXX")"
+  trap 'rm -f "${TMP_QRC}"' EXIT
+  sed 's#../assets/logo.png#../assets/app_icon_1024.png#' "${QRC_PATH}" > "${TMP_QRC}"
+  QRC_PATH="${TMP_QRC}"
+fi
+
+"${RCC_BIN}" "${QRC_PATH}" -o "${OUT_PATH}"
+echo "Created ${OUT_PATH}"
@@ -41,6 +41,6 @@ echo
 
 if [[ "${DO_CLEAN}" -eq 1 ]]; then
   echo "Cleaning local artifacts (dist, iconset, pycache)..."
-  rm -rf dist assets/InSituCore.iconset __pycache__ app/__pycache__ utils/__pycache__ utils/karospace/__pycache__ utils/mana/__pycache__
+  rm -rf dist assets/InSituCore.iconset app/resources_rc.py __pycache__ app/__pycache__ utils/__pycache__ utils/karospace/__pycache__ utils/mana/__pycache__
   echo "Done."
 fi
@@ -0,0 +1,187 @@
+"""Rendering checks for utils.app_visuals on a small synthetic AnnData."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+ad = pytest.importorskip("anndata")
+pytest.importorskip("scanpy")
+sparse = pytest.importorskip("scipy.sparse")
+app_visuals = pytest.importorskip("utils.app_visuals")
+
+
+@pytest.fixture
+def h5ad_path(tmp_path: Path) -> Path:
+    rng = np.random.default_rng(0)
+    n_obs, n_vars = 300, 80
+    obs = pd.DataFrame(
+        {
+            "leiden_1.0": pd.Categorical(rng.integers(0, 4, n_obs).astype(str)),
+            "sample_id": pd.Categorical(rng.choice(["a", "b"], n_obs)),
+        },
+        index=[f"cell{i}" for i in range(n_obs)],
+    )
+    adata = ad.AnnData(
+        X=sparse.random(n_obs, n_vars, density=0.3, format="csr", random_state=1, dtype=np.float32),
+        obs=obs,
+        var=pd.DataFrame(index=[f"gene{i}" for i in range(n_vars)]),
+    )
+    adata.obsm["X_umap"] = rng.normal(size=(n_obs, 2))
+    adata.obsm["X_pca"] = rng.normal(size=(n_obs, 10))
+    adata.obsm["spatial"] = rng.uniform(0, 100, size=(n_obs, 2))
+    path = tmp_path / "data" / "clustered.h5ad"
+    path.parent.mkdir()
+    adata.write_h5ad(path)
+    yield path
+    app_visuals.clear_adata_cache()
+
+
+def test_umap_then_dotplot_share_the_figure(h5ad_path: Path, tmp_path: Path) -> None:
+    # The UMAP leaves a constrained layout engine on the shared figure; the dotplot needs tight.
+    umap_png = tmp_path / "plots" / "umap.png"
+    dotplot_png = tmp_path / "plots" / "gene_expression_dotplot.png"
+    app_visuals.generate_umap_plot(h5ad_path, umap_png, None)
+    app_visuals.generate_gene_expression_dotplot(h5ad_path, dotplot_png, None, 5)
+    app_visuals.generate_umap_plot(h5ad_path, umap_png, None)
+    assert umap_png.is_file()
+    assert dotplot_png.is_file()
+
+
+def test_generate_all_writes_a_2x2_overview(h5ad_path: Path, tmp_path: Path) -> None:
+    import matplotlib.image as mpimg
+
+    # The overview is written to disk, so its panels are drawn at full resolution.
+    panels = [
+        app_visuals.generate_umap_plot(h5ad_path, None, None, preview=False),
+        app_visuals.generate_compartment_map(h5ad_path, None, None, preview=False),
+        app_visuals.generate_spatial_map(h5ad_path, None, None, preview=False),
+        app_visuals.generate_gene_expression_dotplot(h5ad_path, None, None, 10, preview=False),
+    ]
+    overview_png = tmp_path / "plots" / "overview.png"
+    rgba = app_visuals.generate_all(h5ad_path, overview_png)
+
+    umap, compartments, spatial, dotplot = (panel.shape[:2] for panel in panels)
+    height = max(umap[0], compartments[0]) + max(spatial[0], dotplot[0])
+    width = max(umap[1], spatial[1]) + max(compartments[1], dotplot[1])
+    assert rgba.shape == (height, width, 4)
+    assert overview_png.is_file()
+    assert mpimg.imread(overview_png).shape[:2] == (height, width)
+
+
+def test_fast_umap_matches_scanpy_render(h5ad_path: Path, tmp_path: Path) -> None:
+    # A cold call reads the h5ad with h5py; passing an AnnData takes scanpy's embedding plot.
+    fast = app_visuals.generate_umap_plot(h5ad_path, tmp_path / "umap_fast.png", None)
+    assert not app_visuals.is_adata_cached(h5ad_path)
+    reference = app_visuals.generate_umap_plot(
+        h5ad_path, tmp_path / "umap_scanpy.png", None, adata=ad.read_h5ad(h5ad_path)
+    )
+    assert fast.shape == reference.shape
+    assert np.array_equal(fast, reference)
+
+
+@pytest.mark.parametrize("suffix", [".pdf", ".svg"])
+def test_overview_rejects_non_png_output(
+    h5ad_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, suffix: str
+) -> None:
+    output = tmp_path / f"overview{suffix}"
+    with pytest.raises(ValueError, match=r"\.png"):
+        app_visuals.generate_all(h5ad_path, output)
+
+    monkeypatch.setattr(
+        "sys.argv", ["app_visuals", "overview", "--h5ad", str(h5ad_path), "--output", str(output)]
+    )
+    with pytest.raises(SystemExit) as excinfo:
+        app_visuals.main()
+    assert excinfo.value.code == 2
+    assert not output.exists()
+
+
+def test_dotplot_leaves_a_supplied_adata_untouched(h5ad_path: Path) -> None:
+    adata = ad.read_h5ad(h5ad_path)
+    adata.X = sparse.csc_matrix(adata.X, dtype=np.float64)
+    adata.obs["leiden_1.0"] = adata.obs["leiden_1.0"].astype(str)
+    uns_keys = set(adata.uns)
+
+    app_visuals.generate_gene_expression_dotplot(h5ad_path, None, "leiden_1.0", 5, adata=adata)
+
+    assert adata.X.format == "csc"
+    assert adata.X.dtype == np.float64
+    assert adata.obs["leiden_1.0"].dtype == object
+    assert set(adata.uns) == uns_keys
+
+
+def test_fast_umap_lists_unlabelled_cells_as_na(h5ad_path: Path, tmp_path: Path) -> None:
+    adata = ad.read_h5ad(h5ad_path)
+    labels = adata.obs["leiden_1.0"].copy()
+    labels.iloc[:20] = np.nan
+    adata.obs["leiden_1.0"] = labels
+    path = tmp_path / "unlabelled" / "clustered.h5ad"
+    path.parent.mkdir()
+    adata.write_h5ad(path)
+
+    fast = app_visuals.generate_umap_plot(path, None, "leiden_1.0")
+    reference = app_visuals.generate_umap_plot(path, None, "leiden_1.0", adata=ad.read_h5ad(path))
+    assert np.array_equal(fast, reference)
+
+
+def test_spatial_maps_leave_the_cached_uns_alone(h5ad_path: Path) -> None:
+    adata = app_visuals.get_adata(h5ad_path)
+    uns_keys = set(adata.uns)
+    app_visuals.generate_compartment_map(h5ad_path, None, "leiden_1.0")
+    app_visuals.generate_spatial_map(h5ad_path, None, "leiden_1.0")
+    assert app_visuals.get_adata(h5ad_path) is adata
+    assert set(adata.uns) == uns_keys
+
+
+def test_dotplot_ranking_keeps_a_rare_cluster_marker() -> None:
+    # A marker of 10 cells out of 2000 has a low mean overall; it must still reach the t-test.
+    rng = np.random.default_rng(2)
+    n_obs, n_vars = 2000, 6000
+    X = sparse.random(n_obs, n_vars, density=0.02, format="lil", random_state=3, dtype=np.float32)
+    labels = rng.choice(["a", "b", "c"], n_obs).astype(object)
+    labels[:10] = "rare"
+    X[:10, n_vars - 1] = 3.0
+    adata = ad.AnnData(
+        X=X.tocsr(),
+        obs=pd.DataFrame({"leiden_1.0": pd.Categorical(labels)}, index=[f"cell{i}" for i in range(n_obs)]),
+        var=pd.DataFrame(index=[f"gene{i}" for i in range(n_vars)]),
+    )
+
+    subset = app_visuals._subset_for_ranking(adata, "leiden_1.0")
+    assert subset.n_vars == n_vars
+    app_visuals._rank_genes_ttest(subset, "leiden_1.0", "rank", 5)
+    assert subset.uns["rank"]["names"]["rare"][0] == f"gene{n_vars - 1}"
+
+
+def test_default_colour_follows_leiden_column_changes(h5ad_path: Path) -> None:
+    adata = ad.read_h5ad(h5ad_path)
+    uns_keys = set(adata.uns)
+    assert app_visuals._infer_default_color(adata, None) == "leiden_1.0"
+
+    adata.obs["leiden_2.0"] = adata.obs["leiden_1.0"]
+    assert app_visuals._infer_default_color(adata, None) == "leiden_2.0"
+    assert set(adata.uns) == uns_keys
+
+
+def test_written_plots_keep_full_resolution(h5ad_path: Path, tmp_path: Path) -> None:
+    import matplotlib.image as mpimg
+
+    umap_png = tmp_path / "plots" / "umap.png"
+    written = app_visuals.generate_umap_plot(h5ad_path, umap_png, None)
+    preview = app_visuals.generate_umap_plot(h5ad_path, None, None)
+    full = app_visuals.generate_umap_plot(h5ad_path, None, None, preview=False)
+    assert written.shape == full.shape
+    assert preview.shape[1] < full.shape[1]
+    assert mpimg.imread(umap_png).shape[:2] == full.shape[:2]
+
+
+def test_rendering_leaves_global_rcparams_alone(h5ad_path: Path) -> None:
+    import matplotlib
+
+    before = matplotlib.rcParams["agg.path.chunksize"]
+    app_visuals.generate_spatial_map(h5ad_path, None, "leiden_1.0")
+    assert matplotlib.rcParams["agg.path.chunksize"] == before
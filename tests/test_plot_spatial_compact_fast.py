@@ -0,0 +1,56 @@
+"""Raster vs scatter checks for utils.mana.plot_spatial_compact_fast."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+ad = pytest.importorskip("anndata")
+plt = pytest.importorskip("matplotlib.pyplot")
+compact = pytest.importorskip("utils.mana.plot_spatial_compact_fast")
+
+
+def _panel_rgba(adata, raster_threshold):
+    compact.plot_spatial_compact_fast(
+        adata,
+        color="label",
+        groupby="sample_id",
+        cols=1,
+        height=4,
+        palette=["#ff0000", "#0000ff"],
+        raster_threshold=raster_threshold,
+    )
+    fig = plt.gcf()
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba()).copy()
+    # Crop to the panel, leaving out the legend that also shows both colours.
+    x0, y0, x1, y1 = fig.axes[0].get_window_extent().extents.astype(int)
+    plt.close(fig)
+    return rgba[rgba.shape[0] - y1 : rgba.shape[0] - y0, x0:x1]
+
+
+def _count(rgba, rgb):
+    return int((np.abs(rgba[..., :3].astype(int) - rgb).sum(axis=-1) < 30).sum())
+
+
+def test_raster_keeps_cells_under_later_na_cells() -> None:
+    # Every labelled cell has an unlabelled (fully transparent) cell drawn on top of it.
+    rng = np.random.default_rng(0)
+    n = 200
+    coords = rng.uniform(0, 100, size=(n, 2))
+    labels = pd.Categorical(np.r_[np.tile(["a", "b"], n // 2), [np.nan] * n], categories=["a", "b"])
+    adata = ad.AnnData(
+        X=np.zeros((2 * n, 1), dtype=np.float32),
+        obs=pd.DataFrame(
+            {"label": labels, "sample_id": ["s"] * (2 * n)},
+            index=[f"cell{i}" for i in range(2 * n)],
+        ),
+    )
+    adata.obsm["spatial"] = np.vstack([coords, coords])
+
+    scatter = _panel_rgba(adata, raster_threshold=None)
+    raster = _panel_rgba(adata, raster_threshold=0)
+    for rgb in ((255, 0, 0), (0, 0, 255)):
+        assert _count(scatter, rgb) > 0
+        assert _count(raster, rgb) > 0
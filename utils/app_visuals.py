@@ -4,16 +4,37 @@ from __future__ import annotations
 
 import argparse
 import json
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import h5py
 import matplotlib
 
 matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import scanpy as sc
+import matplotlib.image as mpimg  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import scanpy as sc  # noqa: E402
+from matplotlib.colors import to_rgba_array  # noqa: E402
+from scanpy.plotting import palettes  # noqa: E402
+from scipy import sparse  # noqa: E402
 
-from .mana import plot_spatial_compact_fast
+from .mana import plot_spatial_compact_fast  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Installed alongside scanpy; without it the dotplot aggregates with sparse matmuls instead.
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 def _infer_default_color(
@@ -21,49 +42,383 @@ def _infer_default_color(
     cluster_info_path: Optional[Path],
     fallback: str = "leiden",
     preferred_key: Optional[str] = None,
+) -> str:
+    obs_columns = tuple(adata.obs.columns)
+    return _pick_column(
+        obs_columns,
+        _leiden_columns(obs_columns),
+        _cluster_info_stamp(cluster_info_path),
+        preferred_key,
+        fallback,
+    )
+
+
+@lru_cache(maxsize=64)
+def _leiden_columns(obs_columns: tuple[str, ...]) -> tuple[str, ...]:
+    # Keyed on the column names, so added or dropped sweep columns give a fresh list.
+    return tuple(sorted(c for c in obs_columns if c.startswith("leiden_")))
+
+
+def _cluster_info_stamp(cluster_info_path: Optional[Path]) -> Optional[tuple[str, int]]:
+    # (path, mtime) is hashable where the parsed dict is not, and changes when the file is rewritten.
+    if cluster_info_path is None:
+        return None
+    try:
+        return str(cluster_info_path), cluster_info_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_cluster_info_json(stamp: Optional[tuple[str, int]]) -> Optional[dict]:
+    if stamp is None:
+        return None
+    try:
+        return _read_cluster_info(*stamp)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _pick_column(
+    obs_columns: tuple[str, ...],
+    leiden_cols: tuple[str, ...],
+    cluster_info_stamp: Optional[tuple[str, int]],
+    preferred_key: Optional[str],
+    fallback: str,
 ) -> str:
     def _to_candidates(value: object) -> list[str]:
         if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
+            return list(dict.fromkeys(text for text in (str(item).strip() for item in value) if text))
         if isinstance(value, str) and value.strip():
             return [value.strip()]
         return []
 
-    cluster_key = None
-
-    if cluster_info_path and cluster_info_path.is_file():
-        try:
-            payload = json.loads(cluster_info_path.read_text())
-            candidates: list[str] = []
-            if preferred_key:
-                candidates.extend(_to_candidates(payload.get(preferred_key)))
-                if preferred_key.endswith("s"):
-                    candidates.extend(_to_candidates(payload.get(preferred_key[:-1])))
-            if not candidates:
-                candidates.extend(_to_candidates(payload.get("cluster_key")))
-            for candidate in candidates:
-                if candidate in adata.obs.columns:
-                    cluster_key = candidate
-                    break
-        except json.JSONDecodeError:
-            cluster_key = None
-
-    if cluster_key and cluster_key in adata.obs.columns:
-        return cluster_key
-
-    leiden_cols = [c for c in adata.obs.columns if c.startswith("leiden_")]
+    payload = _load_cluster_info_json(cluster_info_stamp)
+    if payload is not None:
+        candidates: list[str] = []
+        if preferred_key:
+            candidates.extend(_to_candidates(payload.get(preferred_key)))
+            if preferred_key.endswith("s"):
+                candidates.extend(_to_candidates(payload.get(preferred_key[:-1])))
+        if not candidates:
+            candidates.extend(_to_candidates(payload.get("cluster_key")))
+        for candidate in dict.fromkeys(candidates):
+            if candidate in obs_columns:
+                return candidate
+
     if leiden_cols:
-        return sorted(leiden_cols)[-1]
+        return leiden_cols[-1]
 
-    if fallback in adata.obs.columns:
+    if fallback in obs_columns:
         return fallback
 
-    if len(adata.obs.columns) > 0:
-        return str(adata.obs.columns[0])
+    if obs_columns:
+        return str(obs_columns[0])
 
     return fallback
 
 
+@lru_cache(maxsize=8)
+def _read_cluster_info(path: str, _mtime_ns: int) -> Optional[dict]:
+    # Keyed on mtime so a rewritten file is parsed again; callers must not mutate the result.
+    raw = Path(path).read_bytes()
+    try:
+        # orjson.JSONDecodeError subclasses json's, so one handler covers both parsers.
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+_ADATA_CACHE: "OrderedDict[tuple[str, int, int], sc.AnnData]" = OrderedDict()
+_ADATA_CACHE_SIZE = 4
+
+
+def get_adata(h5ad_path: Path) -> sc.AnnData:
+    """Return a cached AnnData for h5ad_path, reloading it when the file changes."""
+    stat = h5ad_path.stat()
+    cache_key = (str(h5ad_path), stat.st_mtime_ns, stat.st_size)
+    adata = _ADATA_CACHE.get(cache_key)
+    if adata is not None:
+        _ADATA_CACHE.move_to_end(cache_key)
+        return adata
+
+    for key in [key for key in _ADATA_CACHE if key[0] == cache_key[0]]:
+        close_adata(_ADATA_CACHE.pop(key))
+    adata = load_adata(h5ad_path)
+    _ADATA_CACHE[cache_key] = adata
+    while len(_ADATA_CACHE) > _ADATA_CACHE_SIZE:
+        _, evicted = _ADATA_CACHE.popitem(last=False)
+        close_adata(evicted)
+    return adata
+
+
+def is_adata_cached(h5ad_path: Path) -> bool:
+    """Whether get_adata would answer h5ad_path without reading the file."""
+    try:
+        stat = h5ad_path.stat()
+    except OSError:
+        return False
+    return (str(h5ad_path), stat.st_mtime_ns, stat.st_size) in _ADATA_CACHE
+
+
+def clear_adata_cache() -> None:
+    while _ADATA_CACHE:
+        _, adata = _ADATA_CACHE.popitem()
+        close_adata(adata)
+
+
+def load_adata(h5ad_path: Path, backed: bool = True) -> sc.AnnData:
+    # Backed mode maps .X from disk; obs/obsm (all the map and UMAP plots need) load eagerly.
+    return sc.read_h5ad(h5ad_path, backed="r" if backed else None)
+
+
+def close_adata(adata: sc.AnnData) -> None:
+    # Release the HDF5 handle so the pipeline can rewrite the file.
+    if adata.isbacked:
+        adata.file.close()
+
+
+# Written plots are read by Load Outputs, the QC pages and external tools, so they keep
+# HIGH_RES_DPI; only pixel-only renders (no output path) may drop to PREVIEW_DPI.
+PREVIEW_DPI = 120
+HIGH_RES_DPI = 200
+# zlib level 1: the PNG is rewritten on every regeneration, so encode speed beats file size.
+PNG_COMPRESS_LEVEL = 1
+# --output suffixes matplotlib writes as vector graphics, and the scatter size rasterised in them.
+VECTOR_SUFFIXES = {".pdf", ".svg", ".eps", ".ps"}
+RASTERIZE_MIN_POINTS = 10_000
+# The fast UMAP rasterises its scatter, as scanpy's embedding plot does by default.
+UMAP_RASTERIZED = True
+# Sections with more cells than this are drawn as a binned image rather than a scatter.
+SPATIAL_RASTER_THRESHOLD = 50_000
+# Applied only while this module draws, so importing it leaves matplotlib's global state alone.
+# The chunk size splits long paths so Agg rasterises them in bounded pieces.
+RENDER_RC = {"path.simplify": True, "agg.path.chunksize": 10000}
+
+
+_SHARED_FIGURE: Optional[plt.Figure] = None
+
+
+def _shared_axes(figsize: tuple[float, float], layout: str) -> plt.Axes:
+    """Return a single axes on the reused plot figure, cleared and resized to figsize.
+
+    Keeping one Figure alive between renders spares the canvas, renderer and
+    rcParams setup that a fresh plt.figure() pays on every call. ``layout`` names
+    the matplotlib layout engine solved when the figure is drawn.
+    """
+    global _SHARED_FIGURE
+    if _SHARED_FIGURE is None or not plt.fignum_exists(_SHARED_FIGURE.number):
+        _SHARED_FIGURE = plt.figure()
+    else:
+        _SHARED_FIGURE.clear()
+        plt.figure(_SHARED_FIGURE.number)
+    # clear() keeps the previous plot's engine; switch while the figure has no axes, since
+    # matplotlib refuses a constrained <-> tight change once a colorbar exists.
+    _SHARED_FIGURE.set_layout_engine(layout)
+    _SHARED_FIGURE.set_size_inches(figsize)
+    return _SHARED_FIGURE.add_subplot()
+
+
+def _write_png(output_path: Path, rgba: np.ndarray, dpi: int) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    mpimg.imsave(
+        output_path,
+        rgba,
+        dpi=dpi,
+        pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL, "optimize": False},
+    )
+
+
+def _render_figure(
+    output_path: Optional[Path],
+    preview: bool = True,
+) -> np.ndarray:
+    """Rasterise the current figure once, write it to output_path and return the RGBA pixels.
+
+    With output_path None nothing is written; generate_all tiles the pixels itself.
+    ``preview`` lowers the DPI of such pixel-only renders; anything written to disk
+    is drawn at HIGH_RES_DPI. Any layout engine on the figure is solved during that
+    single draw.
+    """
+    dpi = PREVIEW_DPI if preview and output_path is None else HIGH_RES_DPI
+    fig = plt.gcf()
+    fig.set_dpi(dpi)
+    with matplotlib.rc_context(RENDER_RC):
+        fig.canvas.draw()
+        rgba = np.asarray(fig.canvas.buffer_rgba()).copy()
+        if output_path is not None and output_path.suffix.lower() in VECTOR_SUFFIXES:
+            # A vector export would write every cell as its own path; embed dense scatters as images.
+            for ax in fig.axes:
+                for collection in ax.collections:
+                    if len(collection.get_offsets()) > RASTERIZE_MIN_POINTS:
+                        collection.set_rasterized(True)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            fig.savefig(output_path, dpi=dpi)
+    if output_path is not None and output_path.suffix.lower() not in VECTOR_SUFFIXES:
+        _write_png(output_path, rgba, dpi)
+    if fig is _SHARED_FIGURE:
+        fig.clear()
+    else:
+        plt.close(fig)
+    return rgba
+
+
+def _subset_for_ranking(adata: sc.AnnData, groupby_key: str) -> sc.AnnData:
+    """Drop unlabelled cells; every gene is kept, so markers of small groups can still rank.
+
+    Always returns a new AnnData, so later edits to .X, .obs and .uns never reach the input.
+    """
+    cells = adata.obs[groupby_key].notna().to_numpy()
+    if cells.all():
+        # Nothing to drop: share .X rather than copying it; callers only ever reassign it.
+        cells = slice(None)
+
+    subset = adata if isinstance(cells, slice) else adata[cells]
+    # Only what ranking and the dotplot read; layers such as raw counts are not copied.
+    return sc.AnnData(
+        X=subset.X,
+        obs=subset.obs.copy(),
+        var=subset.var.copy(),
+        obsm={key: np.asarray(value) for key, value in subset.obsm.items()},
+        uns=dict(adata.uns),
+        raw=None if subset.raw is None else subset.raw.to_adata(),
+    )
+
+
+if njit is not None:
+
+    # Serial on purpose: it runs on the app's plot worker thread, and numba's parallel
+    # backends (TBB in particular) can hang interpreter exit when launched off the main thread.
+    @njit(cache=True)
+    def _dotplot_reduce(data, indices, indptr, order, group_starts, n_genes):
+        # Rows are visited group by group, so each output row is written in one pass.
+        n_groups = group_starts.size - 1
+        sums = np.zeros((n_groups, n_genes))
+        expressed = np.zeros((n_groups, n_genes))
+        for group in range(n_groups):
+            for k in range(group_starts[group], group_starts[group + 1]):
+                row = order[k]
+                for p in range(indptr[row], indptr[row + 1]):
+                    value = data[p]
+                    sums[group, indices[p]] += value
+                    if value > 0:
+                        expressed[group, indices[p]] += 1.0
+        return sums, expressed
+
+else:
+    _dotplot_reduce = None
+
+
+def _dense(matrix) -> np.ndarray:
+    return matrix.toarray() if sparse.issparse(matrix) else np.asarray(matrix)
+
+
+def _rank_genes_ttest(adata: sc.AnnData, groupby_key: str, rank_key: str, top_n: int) -> None:
+    """Welch t-test of every group against the rest, for all genes at once.
+
+    Group moments come from two indicator matmuls; the top_n genes per group are
+    stored as uns[rank_key]["names"]/["scores"] records, as rank_genes_groups
+    (method="t-test", reference="rest") would lay them out.
+    """
+    codes = adata.obs[groupby_key].cat.codes.to_numpy()
+    categories = adata.obs[groupby_key].cat.categories
+    cells = np.flatnonzero(codes >= 0)
+    # float64 weights keep the moment sums from losing precision on large groups.
+    indicator = sparse.csr_matrix(
+        (np.ones(cells.size), (codes[cells], cells)), shape=(len(categories), codes.size)
+    )
+    X = adata.X
+    squares = X.multiply(X) if sparse.issparse(X) else np.square(X)
+    sums = _dense(indicator @ X)
+    sq_sums = _dense(indicator @ squares)
+    n_group = np.asarray(indicator.sum(axis=1)).ravel()[:, None]
+    n_rest = cells.size - n_group
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = sums / n_group
+        var = np.maximum(sq_sums - sums * mean, 0) / (n_group - 1)
+        rest_sums = sums.sum(axis=0) - sums
+        rest_mean = rest_sums / n_rest
+        rest_var = np.maximum(sq_sums.sum(axis=0) - sq_sums - rest_sums * rest_mean, 0) / (n_rest - 1)
+        scores = (mean - rest_mean) / np.sqrt(var / n_group + rest_var / n_rest)
+    # Genes with no variance on either side score 0, as in scanpy.
+    scores[~np.isfinite(scores)] = 0
+
+    k = min(top_n, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top = np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1), axis=1)
+    groups = [str(category) for category in categories]
+    var_names = adata.var_names.to_numpy()
+    adata.uns[rank_key] = {
+        "params": {
+            "groupby": groupby_key,
+            "reference": "rest",
+            "method": "t-test",
+            "use_raw": False,
+            "layer": None,
+        },
+        "names": np.rec.fromarrays([var_names[row] for row in top], names=groups),
+        "scores": np.rec.fromarrays(
+            [scores[g, row].astype(np.float32) for g, row in enumerate(top)], names=groups
+        ),
+    }
+
+
+def _ranked_var_names(adata: sc.AnnData, rank_key: str, top_n: int) -> dict[str, list[str]]:
+    # Same selection as rank_genes_groups_dotplot: the first top_n names of each group.
+    names = adata.uns[rank_key]["names"]
+    var_names: dict[str, list[str]] = {}
+    for group in names.dtype.names:
+        genes = [str(gene) for gene in names[group] if isinstance(gene, str)][:top_n]
+        if genes:
+            var_names[group] = genes
+    return var_names
+
+
+def _dotplot_frames(
+    adata: sc.AnnData,
+    groupby_key: str,
+    var_names: dict[str, list[str]],
+) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """Per-group mean expression and fraction expressing, laid out as DotPlot expects."""
+    if adata.raw is not None or not sparse.issparse(adata.X):
+        return None, None
+
+    columns = [gene for genes in var_names.values() for gene in genes]
+    unique_genes = list(dict.fromkeys(columns))
+    X = sparse.csr_matrix(adata.X[:, adata.var_names.get_indexer(unique_genes)])
+    codes = adata.obs[groupby_key].cat.codes.to_numpy()
+    categories = adata.obs[groupby_key].cat.categories
+
+    if _dotplot_reduce is not None:
+        order = np.argsort(codes, kind="stable")
+        order = order[codes[order] >= 0]
+        group_starts = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+        sums, expressed = _dotplot_reduce(
+            X.data, X.indices, X.indptr, order, group_starts, len(unique_genes)
+        )
+        sizes = np.diff(group_starts).astype(float)
+    else:
+        # A 0/1 group-by-cell indicator turns both reductions into sparse matmuls.
+        cells = np.flatnonzero(codes >= 0)
+        indicator = sparse.csr_matrix(
+            (np.ones(cells.size, dtype=np.float32), (codes[cells], cells)),
+            shape=(len(categories), codes.size),
+        )
+        sums = (indicator @ X).toarray()
+        expressed = (indicator @ (X > 0).astype(np.float32)).toarray()
+        sizes = np.asarray(indicator.sum(axis=1)).ravel().astype(float)
+    present = sizes > 0
+    index = categories[present]
+    means = pd.DataFrame(sums[present] / sizes[present, None], index=index, columns=unique_genes)
+    fractions = pd.DataFrame(
+        expressed[present] / sizes[present, None], index=index, columns=unique_genes
+    )
+    # DotPlot's columns repeat genes that are markers of several groups.
+    return means[columns], fractions[columns]
+
+
 def _load_cluster_info_path(h5ad_path: Path) -> Optional[Path]:
     cluster_info = h5ad_path.parent / "cluster_info.json"
     if cluster_info.exists():
@@ -71,8 +426,103 @@ def _load_cluster_info_path(h5ad_path: Path) -> Optional[Path]:
     return None
 
 
-def generate_umap_plot(h5ad_path: Path, output_path: Path, color: Optional[str]) -> None:
-    adata = sc.read_h5ad(h5ad_path)
+def _h5_strings(values: np.ndarray) -> list[str]:
+    # h5py returns variable-length strings as bytes.
+    return [v.decode() if isinstance(v, bytes) else str(v) for v in np.atleast_1d(values)]
+
+
+def _category_palette(n_categories: int) -> list:
+    # Same choice as scanpy when a categorical column has no stored colours.
+    cycle = plt.rcParams["axes.prop_cycle"].by_key().get("color", [])
+    if len(cycle) >= n_categories:
+        return list(cycle[:n_categories])
+    for palette in (palettes.default_20, palettes.default_28, palettes.default_102):
+        if len(palette) >= n_categories:
+            return list(palette[:n_categories])
+    return ["grey"] * n_categories
+
+
+def _fast_umap(h5ad_path: Path, color: Optional[str], ax: plt.Axes) -> bool:
+    """Draw a categorical UMAP from obsm/X_umap and one obs column, without building an AnnData.
+
+    Returns False, with nothing drawn, when the file does not use the expected layout
+    or the colour column is not categorical; the caller then takes the scanpy path.
+    """
+    with h5py.File(h5ad_path, "r") as f:
+        obs = f.get("obs")
+        coords = f.get("obsm/X_umap")
+        if not isinstance(obs, h5py.Group) or not isinstance(coords, h5py.Dataset):
+            return False
+        columns = tuple(_h5_strings(obs.attrs.get("column-order", [])))
+        color_key = color or _pick_column(
+            columns,
+            _leiden_columns(columns),
+            _cluster_info_stamp(_load_cluster_info_path(h5ad_path)),
+            None,
+            "leiden",
+        )
+        column = obs.get(color_key)
+        if not isinstance(column, h5py.Group) or not {"codes", "categories"} <= set(column):
+            return False
+        xy = coords[:, :2]
+        codes = column["codes"][...]
+        categories = _h5_strings(column["categories"][...])
+        stored = f.get(f"uns/{color_key}_colors")
+        colors = _h5_strings(stored[...]) if isinstance(stored, h5py.Dataset) else []
+
+    if len(colors) < len(categories):
+        colors = _category_palette(len(categories))
+    rgba = to_rgba_array(colors[: len(categories)])
+    # Drawn as scanpy's embedding plot draws it: one '.' scatter sized 120000 / n_obs,
+    # unlabelled cells in lightgray and ordered first so labelled cells sit on top.
+    point_rgba = np.vstack([rgba, to_rgba_array(["lightgray"])])
+    color_index = np.where(codes >= 0, codes, len(categories))
+    order = np.argsort(codes >= 0, kind="stable")
+    ax.scatter(
+        xy[order, 0],
+        xy[order, 1],
+        s=120000 / max(codes.size, 1),
+        c=point_rgba[color_index[order]],
+        marker=".",
+        edgecolor="none",
+        plotnonfinite=True,
+        rasterized=UMAP_RASTERIZED,
+    )
+    # Legend layout as in scanpy's right-margin legend, with an "NA" entry for unlabelled cells.
+    legend = list(zip(categories, rgba))
+    if (codes < 0).any():
+        legend.append(("NA", point_rgba[-1]))
+    for label, label_color in legend:
+        ax.scatter([], [], c=[label_color], label=label)
+    ax.legend(
+        frameon=False,
+        loc="center left",
+        bbox_to_anchor=(1, 0.5),
+        ncol=(1 if len(legend) <= 14 else 2 if len(legend) <= 30 else 3),
+    )
+    ax.set_title(color_key)
+    ax.set_xlabel("UMAP1")
+    ax.set_ylabel("UMAP2")
+    ax.set_xticks([])
+    ax.set_yticks([])
+    return True
+
+
+def generate_umap_plot(
+    h5ad_path: Path,
+    output_path: Optional[Path],
+    color: Optional[str],
+    adata: Optional[sc.AnnData] = None,
+    preview: bool = True,
+) -> np.ndarray:
+    # The legend sits outside the axes; constrained layout makes room for it while drawing.
+    ax = _shared_axes(tuple(plt.rcParams["figure.figsize"]), layout="constrained")
+    # A cold call (e.g. a one-shot CLI process) reads just the two arrays it draws.
+    if adata is None and not is_adata_cached(h5ad_path) and _fast_umap(h5ad_path, color, ax):
+        return _render_figure(output_path)
+
+    if adata is None:
+        adata = get_adata(h5ad_path)
     cluster_info = _load_cluster_info_path(h5ad_path)
 
     if "X_umap" not in adata.obsm:
@@ -80,15 +530,30 @@ def generate_umap_plot(h5ad_path: Path, output_path: Path, color: Optional[str])
 
     color_key = color or _infer_default_color(adata, cluster_info)
 
-    sc.pl.umap(adata, color=color_key, show=False)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    sc.pl.umap(adata, color=color_key, ax=ax, show=False)
+    return _render_figure(output_path)
+
 
+@contextmanager
+def _scratch_uns(adata: sc.AnnData) -> Iterator[sc.AnnData]:
+    """Point .uns at a shallow copy while plot_spatial_compact_fast records its colours there."""
+    uns = adata.uns
+    adata.uns = dict(uns)
+    try:
+        yield adata
+    finally:
+        adata.uns = uns
 
-def generate_compartment_map(h5ad_path: Path, output_path: Path, color: Optional[str]) -> None:
-    adata = sc.read_h5ad(h5ad_path)
+
+def generate_compartment_map(
+    h5ad_path: Path,
+    output_path: Optional[Path],
+    color: Optional[str],
+    adata: Optional[sc.AnnData] = None,
+    preview: bool = True,
+) -> np.ndarray:
+    if adata is None:
+        adata = get_adata(h5ad_path)
     cluster_info = _load_cluster_info_path(h5ad_path)
 
     color_key = color or _infer_default_color(
@@ -97,22 +562,28 @@ def generate_compartment_map(h5ad_path: Path, output_path: Path, color: Optional
         preferred_key="compartment_keys",
     )
 
-    plot_spatial_compact_fast(
-        adata,
-        color=color_key,
-        groupby="sample_id",
-        cols=3,
-        height=8,
-        shared_scale=False,
-    )
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    with _scratch_uns(adata):
+        plot_spatial_compact_fast(
+            adata,
+            color=color_key,
+            groupby="sample_id",
+            cols=3,
+            height=8,
+            shared_scale=False,
+            raster_threshold=SPATIAL_RASTER_THRESHOLD,
+        )
+    return _render_figure(output_path)
 
 
-def generate_spatial_map(h5ad_path: Path, output_path: Path, color: Optional[str]) -> None:
-    adata = sc.read_h5ad(h5ad_path)
+def generate_spatial_map(
+    h5ad_path: Path,
+    output_path: Optional[Path],
+    color: Optional[str],
+    adata: Optional[sc.AnnData] = None,
+    preview: bool = True,
+) -> np.ndarray:
+    if adata is None:
+        adata = get_adata(h5ad_path)
     cluster_info = _load_cluster_info_path(h5ad_path)
 
     color_key = color or _infer_default_color(
@@ -124,27 +595,29 @@ def generate_spatial_map(h5ad_path: Path, output_path: Path, color: Optional[str
     if groupby_key not in adata.obs.columns and len(adata.obs.columns) > 0:
         groupby_key = str(adata.obs.columns[0])
 
-    plot_spatial_compact_fast(
-        adata,
-        color=color_key,
-        groupby=groupby_key,
-        cols=3,
-        height=8,
-        shared_scale=False,
-    )
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    with _scratch_uns(adata):
+        plot_spatial_compact_fast(
+            adata,
+            color=color_key,
+            groupby=groupby_key,
+            cols=3,
+            height=8,
+            shared_scale=False,
+            raster_threshold=SPATIAL_RASTER_THRESHOLD,
+        )
+    return _render_figure(output_path)
 
 
 def generate_gene_expression_dotplot(
     h5ad_path: Path,
-    output_path: Path,
+    output_path: Optional[Path],
     groupby: Optional[str],
     top_n: int,
-) -> None:
-    adata = sc.read_h5ad(h5ad_path)
+    adata: Optional[sc.AnnData] = None,
+    preview: bool = True,
+) -> np.ndarray:
+    if adata is None:
+        adata = get_adata(h5ad_path)
     cluster_info = _load_cluster_info_path(h5ad_path)
 
     groupby_key = groupby or _infer_default_color(
@@ -154,23 +627,92 @@ def generate_gene_expression_dotplot(
     )
     if groupby_key not in adata.obs.columns:
         raise ValueError(f"Groupby key '{groupby_key}' not found in adata.obs.")
-    if not str(adata.obs[groupby_key].dtype).startswith("category"):
-        adata.obs[groupby_key] = adata.obs[groupby_key].astype("category")
+    if adata.isbacked:
+        # rank_genes_groups needs .X; the in-memory copy also keeps the results off the shared object.
+        adata = adata.to_memory()
+    adata = _subset_for_ranking(adata, groupby_key)
+    # Row-major float32 halves what the t-test and group reductions stream from memory.
+    if sparse.issparse(adata.X) and adata.X.format != "csr":
+        adata.X = adata.X.tocsr()
+    if adata.X.dtype == np.float64:
+        adata.X = adata.X.astype(np.float32)
+    labels = adata.obs[groupby_key]
+    if not isinstance(labels.dtype, pd.CategoricalDtype):
+        adata.obs[groupby_key] = labels.astype("category")
+    elif labels.cat.categories.size > labels.nunique():
+        # Dropped cells can leave empty levels; ranking iterates every level.
+        adata.obs[groupby_key] = labels.cat.remove_unused_categories()
 
     top_n = max(1, int(top_n))
     rank_key = f"rank_genes_groups__{groupby_key}"
-    sc.tl.rank_genes_groups(adata, groupby=groupby_key, method="t-test", key_added=rank_key)
-    sc.pl.rank_genes_groups_dotplot(
+    if adata.raw is None:
+        _rank_genes_ttest(adata, groupby_key, rank_key, top_n)
+    else:
+        # rank_genes_groups ranks on .raw, a different gene space than .X.
+        sc.tl.rank_genes_groups(adata, groupby=groupby_key, method="t-test", key_added=rank_key)
+    var_names = _ranked_var_names(adata, rank_key, top_n)
+    dot_color_df, dot_size_df = _dotplot_frames(adata, groupby_key, var_names)
+    # Equivalent to rank_genes_groups_dotplot (dendrogram on), with the group statistics precomputed.
+    # DotPlot's fixed-ratio gridspec is not constrained-layout compatible; tight keeps labels in frame.
+    ax = _shared_axes(tuple(plt.rcParams["figure.figsize"]), layout="tight")
+    dotplot = sc.pl.dotplot(
         adata,
-        key=rank_key,
-        n_genes=top_n,
-        show=False,
+        var_names,
+        groupby_key,
+        dendrogram=True,
+        dot_color_df=dot_color_df,
+        dot_size_df=dot_size_df,
+        ax=ax,
+        return_fig=True,
     )
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200)
-    plt.close("all")
+    dotplot.make_figure()
+    # make_figure sizes the plot from the gene and group counts; apply that to the shared figure.
+    ax.figure.set_size_inches(dotplot.width, dotplot.height)
+    return _render_figure(output_path)
+
+
+def _tile_rgba(panels: list[np.ndarray], cols: int = 2) -> np.ndarray:
+    # Each grid column is as wide as its widest panel and each row as tall as its tallest.
+    rows = [panels[i : i + cols] for i in range(0, len(panels), cols)]
+    heights = [max(panel.shape[0] for panel in row) for row in rows]
+    widths = [max(row[c].shape[1] for row in rows if c < len(row)) for c in range(cols)]
+    tiled = np.full((sum(heights), sum(widths), 4), 255, dtype=np.uint8)
+    y = 0
+    for row, height in zip(rows, heights):
+        x = 0
+        for panel, width in zip(row, widths):
+            tiled[y : y + panel.shape[0], x : x + panel.shape[1]] = panel
+            x += width
+        y += height
+    return tiled
+
+
+def generate_all(
+    h5ad_path: Path,
+    output_path: Path,
+    top_n: int = 10,
+    adata: Optional[sc.AnnData] = None,
+) -> np.ndarray:
+    """Render the four app plots with their default keys into one 2x2 overview PNG.
+
+    The panels are drawn in memory and encoded once; the per-plot entry points
+    remain the way to export any one of them, including to vector formats.
+    """
+    if output_path.suffix.lower() != ".png":
+        raise ValueError(
+            f"The overview is a tiled raster image; write it as .png, not {output_path.name!r}."
+        )
+    if adata is None:
+        adata = get_adata(h5ad_path)
+    panels = [
+        generate_umap_plot(h5ad_path, None, None, adata=adata, preview=False),
+        generate_compartment_map(h5ad_path, None, None, adata=adata, preview=False),
+        generate_spatial_map(h5ad_path, None, None, adata=adata, preview=False),
+        generate_gene_expression_dotplot(h5ad_path, None, None, top_n, adata=adata, preview=False),
+    ]
+    rgba = _tile_rgba(panels)
+    _write_png(output_path, rgba, HIGH_RES_DPI)
+    return rgba
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -198,6 +740,11 @@ def build_parser() -> argparse.ArgumentParser:
     dotplot.add_argument("--groupby", default=None, help="Groupby key in adata.obs")
     dotplot.add_argument("--top-n", type=int, default=10, help="Top genes per group (default: 10)")
 
+    overview = sub.add_parser("overview", help="Generate all four plots as one 2x2 image")
+    overview.add_argument("--h5ad", required=True, help="Path to clustered.h5ad")
+    overview.add_argument("--output", required=True, help="Output PNG path")
+    overview.add_argument("--top-n", type=int, default=10, help="Dotplot genes per group (default: 10)")
+
     return parser
 
 
@@ -207,6 +754,8 @@ def main() -> None:
 
     h5ad_path = Path(args.h5ad).expanduser().resolve()
     output_path = Path(args.output).expanduser().resolve()
+    if args.command == "overview" and output_path.suffix.lower() != ".png":
+        parser.error("overview: --output must be a .png path (the overview is a tiled raster image)")
 
     if args.command == "umap":
         generate_umap_plot(h5ad_path, output_path, args.color)
@@ -216,6 +765,20 @@ def main() -> None:
         generate_spatial_map(h5ad_path, output_path, args.color)
     elif args.command == "dotplot":
         generate_gene_expression_dotplot(h5ad_path, output_path, args.groupby, args.top_n)
+    elif args.command == "overview":
+        generate_all(h5ad_path, output_path, args.top_n)
+
+
+def warm_renderer() -> None:
+    """Resolve the default font and prime Agg's glyph cache with one throwaway text draw.
+
+    Only worth it in a long-lived process with idle time before its first plot, such
+    as the app's plot worker; a one-shot render pays the same setup either way.
+    """
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0.5, 0.5, "0")
+    fig.canvas.draw()
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -16,6 +16,58 @@ from pandas.api.types import is_numeric_dtype, is_categorical_dtype
 from scipy.sparse import issparse
 
 
+def _imshow_spots(ax, x, y, colors, panel_size_in, spot_size):
+    """Draw cells as one RGBA image whose pixels are about one scatter spot wide."""
+    x_min, x_max = float(x.min()), float(x.max())
+    y_min, y_max = float(y.min()), float(y.max())
+    span_x = max(x_max - x_min, 1e-9)
+    span_y = max(y_max - y_min, 1e-9)
+    # With equal aspect the tighter panel dimension sets the data-units-per-inch scale.
+    units_per_inch = max(span_x / panel_size_in[0], span_y / panel_size_in[1])
+    cell = units_per_inch * np.sqrt(spot_size) / 72.0
+    n_x = max(1, int(np.ceil(span_x / cell)))
+    n_y = max(1, int(np.ceil(span_y / cell)))
+
+    ix = np.minimum(((x - x_min) / span_x * n_x).astype(np.intp), n_x - 1)
+    iy = np.minimum(((y - y_min) / span_y * n_y).astype(np.intp), n_y - 1)
+    grid = np.zeros((n_y, n_x, 4), dtype=float)
+    # Fully transparent cells (NA, masked) hide nothing under a scatter, so they are skipped.
+    visible = colors[:, 3] > 0
+    ix, iy, colors = ix[visible], iy[visible], colors[visible]
+    if (colors[:, 3] >= 1).all():
+        # Opaque cells: later ones overwrite earlier ones in the same pixel, as later markers would.
+        grid[iy, ix] = colors
+    else:
+        _composite_over(grid.reshape(-1, 4), iy * n_x + ix, colors)
+    ax.imshow(
+        grid,
+        origin="lower",
+        extent=(x_min, x_max, y_min, y_max),
+        interpolation="nearest",
+        aspect="equal",
+    )
+
+
+def _composite_over(flat, pixels, colors):
+    """Alpha-composite colors onto flat (pixel, RGBA) rows in draw order, like stacked markers."""
+    order = np.argsort(pixels, kind="stable")
+    sorted_pixels = pixels[order]
+    starts = np.flatnonzero(np.r_[True, sorted_pixels[1:] != sorted_pixels[:-1]])
+    # The k-th cell of each pixel goes in layer k, so no pixel repeats within a layer.
+    layer = np.arange(order.size) - np.repeat(starts, np.diff(np.r_[starts, order.size]))
+    premult = np.zeros((flat.shape[0], 4))
+    for k in range(int(layer.max()) + 1):
+        cells = order[layer == k]
+        px = pixels[cells]
+        src = colors[cells]
+        keep = 1.0 - src[:, 3:4]
+        premult[px, :3] = src[:, :3] * src[:, 3:4] + premult[px, :3] * keep
+        premult[px, 3] = src[:, 3] + premult[px, 3] * keep[:, 0]
+    alpha = premult[:, 3:4]
+    flat[:, :3] = np.divide(premult[:, :3], alpha, out=np.zeros_like(premult[:, :3]), where=alpha > 0)
+    flat[:, 3] = alpha[:, 0]
+
+
 def plot_spatial_compact_fast(
     ad,
     color="leiden_2",       # obs column *or* gene name
@@ -36,6 +88,7 @@ def plot_spatial_compact_fast(
     vmax=None,
     cmap_name="viridis",
     shared_scale=False,     # if True: vmin/vmax from whole `ad` (not per subset)
+    raster_threshold=None,  # panels with more cells are drawn as one image instead of a scatter
 ):
     """
     Plot spatial data in a compact multi-panel layout.
@@ -80,6 +133,9 @@ def plot_spatial_compact_fast(
         Colormap name for continuous data
     shared_scale : bool
         If True, use same vmin/vmax across all panels for continuous data
+    raster_threshold : int, optional
+        Panels with more cells than this are binned onto a spot-sized pixel grid
+        and drawn with a single imshow; smaller panels keep the scatter path
 
     Returns
     -------
@@ -322,7 +378,15 @@ def plot_spatial_compact_fast(
         ax.set_facecolor(ax_face)
 
         idx = group_indices[i]
-        if idx.size:
+        if raster_threshold is not None and idx.size > raster_threshold:
+            xy = coords[idx]
+            y = -xy[:, 1] if invert_y else xy[:, 1]
+            _imshow_spots(
+                ax, xy[:, 0], y, colors_arr[idx],
+                panel_size_in=(panel_w / cols, height / rows),
+                spot_size=spot_size,
+            )
+        elif idx.size:
             xy = coords[idx]
             y = -xy[:, 1] if invert_y else xy[:, 1]
             ax.scatter(